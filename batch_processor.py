@@ -10,12 +10,28 @@
 
 import os
 import sys
+import gc
 import json
 import time
-import pandas as pd
+import hashlib
+import asyncio
+from openpyxl import Workbook, load_workbook
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+import multiprocessing
 import threading
+import logging
+from functools import lru_cache
+
+# 로거 (스레드 안전, 고객 병렬 처리 시 print 대신 사용)
+logger = logging.getLogger('saju')
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 # 음력 변환
 from korean_lunar_calendar import KoreanLunarCalendar
@@ -36,17 +52,20 @@ from image_generator import (
 # ZODIAC_PATH 설정
 ZODIAC_PATH = os.path.join(os.path.dirname(__file__), 'images', 'zodiac')
 
-# 음력/양력 변환 함수
+# 음력/양력 변환 함수 (순수 함수 → 캐싱)
+@lru_cache(maxsize=4096)
 def 음력_to_양력(year, month, day, 윤달=False):
     calendar = KoreanLunarCalendar()
     calendar.setLunarDate(year, month, day, 윤달)
     return calendar.solarYear, calendar.solarMonth, calendar.solarDay
 
+@lru_cache(maxsize=4096)
 def 양력_to_음력(year, month, day):
     calendar = KoreanLunarCalendar()
     calendar.setSolarDate(year, month, day)
     return calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay, calendar.isIntercalation
 
+@lru_cache(maxsize=4096)
 def 음력_문자열(year, month, day, 윤달=False):
     윤_표시 = "윤" if 윤달 else ""
     return f"{year}-{윤_표시}{month:02d}-{day:02d}"
@@ -144,7 +163,7 @@ def generate_gpt_text(사주, 기본정보, gender, 대운_data, 세운_data, 
     
     return text
 from pdf_generator_v2 import create_full_pdf
-from google_drive import upload_to_drive
+from google_drive import upload_to_drive, get_drive_service
 from delivery import send_email, get_default_email_template
 
 # ============================================
@@ -199,6 +218,14 @@ class Config:
     @property
     def parallel_chapters(self):
         return self.config.get('parallel_chapters', 5)
+    
+    @property
+    def parallel_customers(self):
+        return self.config.get('parallel_customers', 4)
+    
+    @property
+    def image_processes(self):
+        return self.config.get('image_processes', 4)
 
 
 # ============================================
@@ -224,68 +251,386 @@ CHAPTER_INFO = {
 
 
 # ============================================
-# Claude API 병렬 호출
+# 마스터 프롬프트
+# ============================================
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
+
+
+def find_master_prompt_path():
+    """마스터 프롬프트 파일 경로 (00_master_prompt.txt 우선)"""
+    prompt_path = os.path.join(PROMPTS_DIR, "00_master_prompt.txt")
+    if not os.path.exists(prompt_path):
+        prompt_path = os.path.join(PROMPTS_DIR, "00_마스터프롬프트.txt")
+    return prompt_path
+
+
+@lru_cache(maxsize=8)
+def load_master_prompt(prompt_path):
+    """마스터 프롬프트 로드 (경로별 캐시)"""
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# ============================================
+# Claude API 병렬 호출 (asyncio)
 # ============================================
-def generate_chapter(client, model, master_prompt, gpt_text, chapter_num, customer_name):
-    """단일 장 생성"""
+# 모든 고객이 하나의 이벤트 루프 + 클라이언트(연결 풀)를 공유
+_claude_lock = threading.Lock()
+_claude_loop = None
+_client_cache = {}
+
+
+def _get_event_loop():
+    """Claude 호출 전용 이벤트 루프 (백그라운드 스레드에서 상시 실행)"""
+    global _claude_loop
+    with _claude_lock:
+        if _claude_loop is None:
+            _claude_loop = asyncio.new_event_loop()
+            threading.Thread(target=_claude_loop.run_forever, name='claude-loop', daemon=True).start()
+        return _claude_loop
+
+
+def _get_client(api_key):
+    """API 키별 AsyncAnthropic 클라이언트 캐시"""
+    with _claude_lock:
+        client = _client_cache.get(api_key)
+        if client is None:
+            import anthropic
+            import httpx
+            client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                )
+            )
+            _client_cache[api_key] = client
+        return client
+
+
+# 장 생성 실패 시 본문 대신 돌려주는 문구의 머리말 (PDF 조립 전에 실패 여부 확인용)
+CHAPTER_ERROR_PREFIX = "[오류] "
+
+
+async def generate_chapter(client, model, system_blocks, data_block, chapter_num, customer_name, semaphore):
+    """
+    단일 장 생성
+    
+    Args:
+        system_blocks: 마스터 프롬프트 블록 (고객별 1회 생성, 15장 공유)
+        data_block: [사주 데이터] 블록 (고객별 1회 생성, 15장 공유)
+    """
     chapter_title = CHAPTER_INFO.get(chapter_num, "")
     
-    user_message = f"""[사주 데이터]
-{gpt_text}
-
-위 데이터를 바탕으로 "제{chapter_num}장. {chapter_title}"을 작성해주세요.
+    user_content = [
+        data_block,
+        {
+            "type": "text",
+            "text": f"""위 데이터를 바탕으로 "제{chapter_num}장. {chapter_title}"을 작성해주세요.
 목차의 소주제를 모두 포함하여 작성하세요.
 고객명: {customer_name}"""
+        }
+    ]
     
     try:
-        response = client.messages.create(
+        async with semaphore:
+            response = await client.messages.create(
+                model=model,
+                max_tokens=8000,
+                system=system_blocks,
+                messages=[{"role": "user", "content": user_content}]
+            )
+        return chapter_num, response.content[0].text
+    except Exception as e:
+        return chapter_num, f"{CHAPTER_ERROR_PREFIX}제{chapter_num}장 생성 실패: {str(e)}"
+
+
+async def warm_prompt_cache(client, model, system_blocks, data_block):
+    """
+    프롬프트 캐시 미리 채우기 (max_tokens=1 요청)
+    
+    캐시가 비어 있을 때 15장을 동시에 보내면 모든 요청이 캐시 쓰기 비용만 내고 읽기는 못 하므로,
+    같은 system/데이터 블록으로 짧은 요청을 먼저 보내 캐시를 만듭니다. 실패해도 무시합니다.
+    """
+    try:
+        await client.messages.create(
             model=model,
-            max_tokens=8000,
-            system=master_prompt,
-            messages=[{"role": "user", "content": user_message}]
+            max_tokens=1,
+            system=system_blocks,
+            messages=[{"role": "user", "content": [data_block, {"type": "text", "text": "."}]}]
         )
-        return chapter_num, response.content[0].text
     except Exception as e:
-        return chapter_num, f"[오류] 제{chapter_num}장 생성 실패: {str(e)}"
+        logger.warning("[경고] 프롬프트 캐시 준비 실패 (캐시 없이 진행): %s", e)
 
 
-def generate_all_chapters_parallel(api_key, model, master_prompt, gpt_text, customer_name, max_workers=5, progress_callback=None):
-    """15장 병렬 생성"""
-    import anthropic
-    client = anthropic.Anthropic(api_key=api_key)
+async def generate_all_chapters_async(api_key, model, master_prompt, gpt_text, customer_name, max_concurrency=None, progress_callback=None):
+    """
+    15장 동시 생성 (단일 이벤트 루프)
+    
+    Args:
+        max_concurrency: 동시 요청 수 제한 (None이면 15장 전부 동시)
+    """
+    client = _get_client(api_key)
+    
+    # 마스터 프롬프트 + 사주 데이터는 15장 공통 → 1회만 구성, 프롬프트 캐시 대상
+    system_blocks = [{
+        "type": "text",
+        "text": master_prompt,
+        "cache_control": {"type": "ephemeral"}
+    }]
+    data_block = {
+        "type": "text",
+        "text": f"[사주 데이터]\n{gpt_text}",
+        "cache_control": {"type": "ephemeral"}
+    }
     
     chapters = {}
     total = 15
     completed = 0
-    lock = threading.Lock()
+    semaphore = asyncio.Semaphore(max_concurrency or total)
     
-    def update_progress(ch_num):
+    def chapter_done(ch_num, content):
         nonlocal completed
-        with lock:
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total, f"제{ch_num}장 완료")
+        chapters[ch_num] = content
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total, "제%d장 완료", ch_num)
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(
-                generate_chapter, client, model, master_prompt, gpt_text, ch_num, customer_name
-            ): ch_num for ch_num in range(1, 16)
-        }
-        
-        for future in as_completed(futures):
-            ch_num, content = future.result()
-            chapters[ch_num] = content
-            update_progress(ch_num)
+    # 짧은 요청으로 캐시를 채운 뒤 15장 동시 요청 (장 하나를 기다리지 않음)
+    await warm_prompt_cache(client, model, system_blocks, data_block)
+    
+    tasks = [
+        asyncio.create_task(
+            generate_chapter(client, model, system_blocks, data_block, ch_num, customer_name, semaphore)
+        ) for ch_num in range(1, 16)
+    ]
+    
+    for next_done in asyncio.as_completed(tasks):
+        chapter_done(*await next_done)
     
     # 정렬해서 반환
     return {k: chapters[k] for k in sorted(chapters.keys())}
 
 
+def generate_all_chapters_parallel(api_key, model, master_prompt, gpt_text, customer_name, max_workers=None, progress_callback=None):
+    """15장 병렬 생성 (동기 호출용 래퍼 - 공유 이벤트 루프에서 실행)"""
+    future = asyncio.run_coroutine_threadsafe(
+        generate_all_chapters_async(
+            api_key, model, master_prompt, gpt_text, customer_name,
+            max_concurrency=max_workers,
+            progress_callback=progress_callback
+        ),
+        _get_event_loop()
+    )
+    return future.result()
+
+
+# ============================================
+# 이미지 병렬 렌더링
+# ============================================
+def render_images(image_tasks, executor=None):
+    """
+    이미지 생성 태스크 병렬 실행
+    
+    Args:
+        image_tasks: [(create_함수, 인자튜플), ...]
+        executor: ProcessPoolExecutor 등 공유 풀 (없으면 임시 스레드 풀)
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            render_images(image_tasks, pool)
+        return
+    
+    futures = [executor.submit(func, *args) for func, args in image_tasks]
+    for future in as_completed(futures):
+        future.result()
+
+
 # ============================================
 # 1명 고객 처리
 # ============================================
-def process_customer(row, config, master_prompt, progress_callback=None):
+INPUT_HASH_FILE = ".input.sha1"   # 이 입력으로 PDF 생성 + 발송까지 완료
+BUILT_HASH_FILE = ".built.sha1"   # 이 입력으로 PDF 생성 완료 (발송은 미확인)
+
+
+def _read_hash(path):
+    """완료 표시 파일의 해시 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def row_input_hash(row):
+    """고객 입력 행 해시 (입력이 바뀌었을 때만 재생성하기 위함)"""
+    data = {k: v for k, v in dict(row).items() if k != 'force_rerun'}
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+# 고객 폴더별 잠금 (같은 폴더를 쓰는 행은 병렬 배치에서도 순서대로 처리)
+_customer_dir_locks = {}
+_customer_dir_locks_guard = threading.Lock()
+
+
+def customer_dir(output_dir, row):
+    """
+    고객 출력 폴더 (이름 + 입력 해시)
+    
+    동명이인이 병렬로 처리되어도 이미지/PDF가 섞이지 않도록 이름만으로 폴더를 나누지 않습니다.
+    """
+    return os.path.join(output_dir, f"{row['이름']}_{row_input_hash(row)[:8]}")
+
+
+def _customer_dir_lock(path):
+    with _customer_dir_locks_guard:
+        lock = _customer_dir_locks.get(path)
+        if lock is None:
+            lock = _customer_dir_locks[path] = threading.Lock()
+        return lock
+
+
+def _build_customer_pdf(row, config, master_prompt, name, pdf_dir, pdf_path, progress_callback, image_executor):
+    """
+    1~4단계: 사주 계산 → 이미지 17종 → 15장 생성 → PDF 조립
+    
+    한 장이라도 생성에 실패하면 PDF를 만들지 않고 예외를 냅니다.
+    PDF가 완성되면 생성 완료 표시(BUILT_HASH_FILE)를 남깁니다.
+    """
+    # 다시 만드는 동안/실패 시 이전 완료 표시가 남지 않도록 먼저 제거
+    for marker in (BUILT_HASH_FILE, INPUT_HASH_FILE):
+        marker_path = os.path.join(pdf_dir, marker)
+        if os.path.exists(marker_path):
+            os.remove(marker_path)
+    
+    # ============================================
+    # 1단계: 사주 계산
+    # ============================================
+    if progress_callback:
+        progress_callback(1, 7, "%s: 사주 계산 중...", name)
+    
+    # 날짜 (로드 시 datetime 으로 변환됨)
+    birth_date = row['생년월일']
+    if isinstance(birth_date, str):
+        raise ValueError(f"생년월일 형식 오류 (YYYY-MM-DD): {birth_date}")
+    
+    input_year = birth_date.year
+    input_month = birth_date.month
+    input_day = birth_date.day
+    hour = int(row.get('시', 12))
+    minute = int(row.get('분', 0))
+    gender_str = row.get('성별', '남성')
+    calendar_type = row.get('음양력', '양력')
+    is_leap = row.get('윤달', False)
+    
+    if calendar_type == "음력":
+        year, month, day = 음력_to_양력(input_year, input_month, input_day, is_leap)
+        음력_str = 음력_문자열(input_year, input_month, input_day, is_leap)
+        양력_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
+    else:
+        year, month, day = input_year, input_month, input_day
+        양력_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
+        음력_year, 음력_month, 음력_day, 음력_윤달 = 양력_to_음력(year, month, day)
+        음력_str = 음력_문자열(음력_year, 음력_month, 음력_day, 음력_윤달)
+    
+    사주 = calc_사주(year, month, day, hour, minute)
+    나이 = datetime.now().year - year + 1
+    gender = '남' if gender_str == '남성' else '여'
+    
+    기본정보 = {
+        '이름': name,
+        '성별': gender_str,
+        '나이': 나이,
+        '양력': 양력_str,
+        '음력': 음력_str,
+    }
+    
+    # 운세 계산 (위에서 계산한 사주 재사용)
+    대운_data = calc_대운(year, month, day, hour, minute, gender, 사주=사주)
+    세운_data = calc_세운(year, month, day, hour, minute, 사주=사주)
+    월운_data = calc_월운(year, month, day, hour, minute, 사주=사주)
+    신살_data = calc_신살(사주, gender)
+    
+    # GPT 텍스트
+    gpt_text = generate_gpt_text(사주, 기본정보, gender, 대운_data, 세운_data, 월운_data, 신살_data)
+    
+    # ============================================
+    # 2단계: 이미지 17종 생성
+    # ============================================
+    if progress_callback:
+        progress_callback(2, 7, "%s: 이미지 17종 생성 중...", name)
+    
+    img_dir = os.path.join(pdf_dir, "images")
+    os.makedirs(img_dir, exist_ok=True)
+    
+    # 이미지 생성 (병렬)
+    image_tasks = [
+        (create_원국표, (사주, 기본정보, f"{img_dir}/01_원국표.png", 신살_data, ZODIAC_PATH)),
+        (create_대운표, (대운_data, 기본정보, f"{img_dir}/02_대운표.png")),
+        (create_세운표, (세운_data, 기본정보, f"{img_dir}/03_세운표.png")),
+        (create_월운표, (월운_data, 기본정보, f"{img_dir}/04_월운표.png")),
+        (create_오행차트, (사주, 기본정보, f"{img_dir}/05_오행분석.png")),
+        (create_십성표, (사주, 기본정보, f"{img_dir}/06_십성표.png")),
+        (create_신살표, (신살_data, 기본정보, f"{img_dir}/07_신살표.png")),
+        (create_12운성표, (사주, 기본정보, f"{img_dir}/08_12운성표.png")),
+        (create_지장간표, (사주, 기본정보, f"{img_dir}/09_지장간표.png")),
+        (create_합충형파해표, (사주, 기본정보, f"{img_dir}/10_합충형파해표.png")),
+        (create_궁성표, (사주, 기본정보, f"{img_dir}/11_궁성표.png")),
+        (create_육친표, (사주, 기본정보, gender, f"{img_dir}/12_육친표.png")),
+        (create_납음오행표, (사주, 기본정보, f"{img_dir}/13_납음오행표.png")),
+        (create_격국표, (사주, 기본정보, f"{img_dir}/14_격국표.png")),
+        (create_공망표, (사주, 기본정보, f"{img_dir}/15_공망표.png")),
+        (create_용신표, (사주, 기본정보, f"{img_dir}/16_용신표.png")),
+    ]
+    
+    render_images(image_tasks, image_executor)
+    
+    # ============================================
+    # 3단계: Claude API 15장 병렬 생성
+    # ============================================
+    if progress_callback:
+        progress_callback(3, 7, "%s: Claude API 15장 생성 중 (병렬)...", name)
+    
+    def chapter_progress(completed, total, fmt, *args):
+        if progress_callback:
+            progress_callback(3, 7, "%s: " + fmt + " (%d/%d)", name, *args, completed, total)
+    
+    chapters = generate_all_chapters_parallel(
+        api_key=config.anthropic_api_key,
+        model=config.model,
+        master_prompt=master_prompt,
+        gpt_text=gpt_text,
+        customer_name=name,
+        max_workers=config.parallel_chapters,
+        progress_callback=chapter_progress
+    )
+    
+    # 실패한 장이 있으면 오류 문구가 든 PDF를 만들지 않음 (다음 배치에서 다시 생성)
+    failed = [ch_num for ch_num, text in chapters.items() if text.startswith(CHAPTER_ERROR_PREFIX)]
+    if failed:
+        raise RuntimeError(f"장 생성 실패: {', '.join(f'제{n}장' for n in sorted(failed))}")
+    
+    # ============================================
+    # 4단계: PDF 조립
+    # ============================================
+    if progress_callback:
+        progress_callback(4, 7, "%s: PDF 조립 중...", name)
+    
+    os.makedirs(pdf_dir, exist_ok=True)
+    
+    create_full_pdf(
+        chapters=chapters,
+        images_dir=img_dir,
+        customer_name=name,
+        output_path=pdf_path,
+        기본정보=기본정보
+    )
+    
+    # 같은 입력으로 PDF 생성 완료 → 발송만 실패하면 다음 배치는 PDF 재사용
+    with open(os.path.join(pdf_dir, BUILT_HASH_FILE), 'w', encoding='utf-8') as f:
+        f.write(row_input_hash(row))
+
+
+def process_customer(row, config, master_prompt, progress_callback=None, drive_service=None, image_executor=None):
     """
     1명 고객 전체 처리
     
@@ -293,11 +638,19 @@ def process_customer(row, config, master_prompt, progress_callback=None):
         row: 엑셀 행 (이름, 생년월일, 시, 분, 성별, 음양력, 윤달, 이메일, 전화번호)
         config: Config 객체
         master_prompt: 마스터 프롬프트
-        progress_callback: (step, total_steps, message) 콜백
+        progress_callback: (step, total_steps, fmt, *args) 콜백 - 로그 포맷 문자열과 인자
+                           (포맷은 로그 출력 시점에만 수행)
+        drive_service: 공유 Drive 서비스 (없으면 업로드마다 인증)
+        image_executor: 공유 이미지 렌더링 풀 (없으면 스레드 풀 사용)
     
     Returns:
         결과 딕셔너리
     """
+    with _customer_dir_lock(customer_dir(config.output_dir, row)):
+        return _process_customer(row, config, master_prompt, progress_callback, drive_service, image_executor)
+
+
+def _process_customer(row, config, master_prompt, progress_callback, drive_service, image_executor):
     result = {
         'name': row['이름'],
         'success': False,
@@ -305,6 +658,7 @@ def process_customer(row, config, master_prompt, progress_callback=None):
         'drive_link': None,
         'email_sent': False,
         'kakao_sent': False,
+        'skipped': False,
         'error': None
     }
     
@@ -312,140 +666,55 @@ def process_customer(row, config, master_prompt, progress_callback=None):
         name = row['이름']
         
         # ============================================
-        # 1단계: 사주 계산
-        # ============================================
-        if progress_callback:
-            progress_callback(1, 7, f"{name}: 사주 계산 중...")
-        
-        # 날짜 파싱
-        birth_date = row['생년월일']
-        if isinstance(birth_date, str):
-            birth_date = datetime.strptime(birth_date, '%Y-%m-%d')
-        
-        input_year = birth_date.year
-        input_month = birth_date.month
-        input_day = birth_date.day
-        hour = int(row.get('시', 12))
-        minute = int(row.get('분', 0))
-        gender_str = row.get('성별', '남성')
-        calendar_type = row.get('음양력', '양력')
-        is_leap = row.get('윤달', False)
-        
-        if calendar_type == "음력":
-            year, month, day = 음력_to_양력(input_year, input_month, input_day, is_leap)
-            음력_str = 음력_문자열(input_year, input_month, input_day, is_leap)
-            양력_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
-        else:
-            year, month, day = input_year, input_month, input_day
-            양력_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
-            음력_year, 음력_month, 음력_day, 음력_윤달 = 양력_to_음력(year, month, day)
-            음력_str = 음력_문자열(음력_year, 음력_month, 음력_day, 음력_윤달)
-        
-        사주 = calc_사주(year, month, day, hour, minute)
-        나이 = datetime.now().year - year + 1
-        gender = '남' if gender_str == '남성' else '여'
-        
-        기본정보 = {
-            '이름': name,
-            '성별': gender_str,
-            '나이': 나이,
-            '양력': 양력_str,
-            '음력': 음력_str,
-        }
-        
-        # 운세 계산
-        대운_data = calc_대운(year, month, day, hour, minute, gender)
-        세운_data = calc_세운(year, month, day, hour, minute)
-        월운_data = calc_월운(year, month, day, hour, minute)
-        신살_data = calc_신살(사주, gender)
-        
-        # GPT 텍스트
-        gpt_text = generate_gpt_text(사주, 기본정보, gender, 대운_data, 세운_data, 월운_data, 신살_data)
-        
-        # ============================================
-        # 2단계: 이미지 17종 생성
-        # ============================================
-        if progress_callback:
-            progress_callback(2, 7, f"{name}: 이미지 17종 생성 중...")
-        
-        img_dir = os.path.join(config.output_dir, name, "images")
-        os.makedirs(img_dir, exist_ok=True)
-        
-        # 이미지 생성
-        create_원국표(사주, 기본정보, f"{img_dir}/01_원국표.png", 신살_data, ZODIAC_PATH)
-        create_대운표(대운_data, 기본정보, f"{img_dir}/02_대운표.png")
-        create_세운표(세운_data, 기본정보, f"{img_dir}/03_세운표.png")
-        create_월운표(월운_data, 기본정보, f"{img_dir}/04_월운표.png")
-        create_오행차트(사주, 기본정보, f"{img_dir}/05_오행분석.png")
-        create_십성표(사주, 기본정보, f"{img_dir}/06_십성표.png")
-        create_신살표(신살_data, 기본정보, f"{img_dir}/07_신살표.png")
-        create_12운성표(사주, 기본정보, f"{img_dir}/08_12운성표.png")
-        create_지장간표(사주, 기본정보, f"{img_dir}/09_지장간표.png")
-        create_합충형파해표(사주, 기본정보, f"{img_dir}/10_합충형파해표.png")
-        create_궁성표(사주, 기본정보, f"{img_dir}/11_궁성표.png")
-        create_육친표(사주, 기본정보, gender, f"{img_dir}/12_육친표.png")
-        create_납음오행표(사주, 기본정보, f"{img_dir}/13_납음오행표.png")
-        create_격국표(사주, 기본정보, f"{img_dir}/14_격국표.png")
-        create_공망표(사주, 기본정보, f"{img_dir}/15_공망표.png")
-        create_용신표(사주, 기본정보, f"{img_dir}/16_용신표.png")
-        
-        # ============================================
-        # 3단계: Claude API 15장 병렬 생성
+        # 0단계: 재실행 생략
+        # - 같은 입력으로 발송까지 끝났으면 전체 생략
+        # - PDF만 만들어졌으면 PDF 재사용, 발송만 다시 시도
         # ============================================
-        if progress_callback:
-            progress_callback(3, 7, f"{name}: Claude API 15장 생성 중 (병렬)...")
-        
-        def chapter_progress(completed, total, msg):
-            if progress_callback:
-                progress_callback(3, 7, f"{name}: {msg} ({completed}/{total})")
-        
-        chapters = generate_all_chapters_parallel(
-            api_key=config.anthropic_api_key,
-            model=config.model,
-            master_prompt=master_prompt,
-            gpt_text=gpt_text,
-            customer_name=name,
-            max_workers=config.parallel_chapters,
-            progress_callback=chapter_progress
-        )
-        
-        # ============================================
-        # 4단계: PDF 조립
-        # ============================================
-        if progress_callback:
-            progress_callback(4, 7, f"{name}: PDF 조립 중...")
-        
-        pdf_dir = os.path.join(config.output_dir, name)
-        os.makedirs(pdf_dir, exist_ok=True)
+        pdf_dir = customer_dir(config.output_dir, row)
         pdf_path = os.path.join(pdf_dir, f"{name}_사주보고서.pdf")
+        hash_path = os.path.join(pdf_dir, INPUT_HASH_FILE)
+        input_hash = row_input_hash(row)
+        reuse_pdf = False
+        
+        if os.path.exists(pdf_path) and not row.get('force_rerun'):
+            if _read_hash(hash_path) == input_hash:
+                if progress_callback:
+                    progress_callback(7, 7, "%s: ⏭️ 기존 PDF 사용 (생략)", name)
+                result.update(success=True, pdf_path=pdf_path, skipped=True)
+                return result
+            
+            reuse_pdf = _read_hash(os.path.join(pdf_dir, BUILT_HASH_FILE)) == input_hash
         
-        create_full_pdf(
-            chapters=chapters,
-            images_dir=img_dir,
-            customer_name=name,
-            output_path=pdf_path,
-            기본정보=기본정보
-        )
+        if reuse_pdf:
+            if progress_callback:
+                progress_callback(4, 7, "%s: ♻️ 기존 PDF 재사용 (발송만 다시 시도)", name)
+        else:
+            _build_customer_pdf(row, config, master_prompt, name, pdf_dir, pdf_path, progress_callback, image_executor)
+            # 장 본문/사주 텍스트는 PDF에 반영됨 → 업로드·발송 대기 중 메모리 해제
+            gc.collect()
         
         result['pdf_path'] = pdf_path
+        delivered = True  # 설정된 발송 단계가 모두 성공했는지 (발송 완료 표시 기록 조건)
         
         # ============================================
         # 5단계: Google Drive 업로드
         # ============================================
         if config.drive_folder_id and config.drive_credentials:
             if progress_callback:
-                progress_callback(5, 7, f"{name}: Drive 업로드 중...")
+                progress_callback(5, 7, "%s: Drive 업로드 중...", name)
             
             try:
                 drive_result = upload_to_drive(
                     file_path=pdf_path,
                     folder_id=config.drive_folder_id,
                     credentials_json=config.drive_credentials,
-                    file_name=f"{name}_사주보고서.pdf"
+                    file_name=f"{name}_사주보고서.pdf",
+                    service=drive_service
                 )
                 result['drive_link'] = drive_result['web_link']
             except Exception as e:
-                print(f"[경고] {name} Drive 업로드 실패: {e}")
+                delivered = False
+                logger.warning("[경고] %s Drive 업로드 실패: %s", name, e)
         
         # ============================================
         # 6단계: 이메일 발송
@@ -453,7 +722,7 @@ def process_customer(row, config, master_prompt, progress_callback=None):
         email = row.get('이메일', '')
         if email and config.gmail_email and config.gmail_password:
             if progress_callback:
-                progress_callback(6, 7, f"{name}: 이메일 발송 중...")
+                progress_callback(6, 7, "%s: 이메일 발송 중...", name)
             
             try:
                 email_body = get_default_email_template().format(
@@ -471,8 +740,11 @@ def process_customer(row, config, master_prompt, progress_callback=None):
                 )
                 
                 result['email_sent'] = email_result['success']
+                if not email_result['success']:
+                    delivered = False
             except Exception as e:
-                print(f"[경고] {name} 이메일 발송 실패: {e}")
+                delivered = False
+                logger.warning("[경고] %s 이메일 발송 실패: %s", name, e)
         
         # ============================================
         # 7단계: 카카오 알림톡 (선택)
@@ -480,22 +752,25 @@ def process_customer(row, config, master_prompt, progress_callback=None):
         phone = row.get('전화번호', '')
         if phone and config.kakao_api_key:
             if progress_callback:
-                progress_callback(7, 7, f"{name}: 카카오 발송 중...")
+                progress_callback(7, 7, "%s: 카카오 발송 중...", name)
             
             # 카카오 알림톡은 별도 설정 필요
             # 여기서는 로그만 남김
-            print(f"[INFO] {name} 카카오 알림톡 발송 대기: {phone}")
+            logger.info("[INFO] %s 카카오 알림톡 발송 대기: %s", name, phone)
         
         result['success'] = True
         
+        # 업로드·발송까지 끝난 경우에만 기록 → 실패/중단 시 다음 배치에서 다시 처리
+        if delivered:
+            with open(hash_path, 'w', encoding='utf-8') as f:
+                f.write(input_hash)
+        
         if progress_callback:
-            progress_callback(7, 7, f"{name}: ✅ 완료!")
+            progress_callback(7, 7, "%s: ✅ 완료!", name)
         
     except Exception as e:
         result['error'] = str(e)
-        print(f"[오류] {row.get('이름', 'Unknown')} 처리 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[오류] %s 처리 실패: %s", row.get('이름', 'Unknown'), e)
     
     return result
 
@@ -503,6 +778,54 @@ def process_customer(row, config, master_prompt, progress_callback=None):
 # ============================================
 # 메인 배치 처리
 # ============================================
+RESULT_COLUMNS = ['name', 'success', 'pdf_path', 'drive_link', 'email_sent', 'kakao_sent', 'skipped', 'error']
+
+
+def write_result_rows(result_path, results):
+    """결과 엑셀 저장 (openpyxl write_only 스트리밍)"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(RESULT_COLUMNS)
+    for r in results:
+        ws.append([r.get(col) for col in RESULT_COLUMNS])
+    wb.save(result_path)
+
+
+def parse_birth_date(value):
+    """생년월일 문자열(YYYY-MM-DD) → datetime (엑셀 날짜 셀은 그대로)"""
+    if isinstance(value, str):
+        return datetime.strptime(value.strip(), '%Y-%m-%d')
+    return value
+
+
+def read_customer_rows(excel_path):
+    """
+    엑셀 고객 목록 읽기 (openpyxl read_only 스트리밍)
+    
+    Returns:
+        [{헤더: 값, ...}, ...] - 빈 행 제외
+    """
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        row_iter = ws.iter_rows(values_only=True)
+        headers = [str(h).strip() if h is not None else '' for h in next(row_iter, ())]
+        
+        rows = []
+        for values in row_iter:
+            if all(v is None for v in values):
+                continue
+            row = {h: v for h, v in zip(headers, values) if h}
+            try:
+                row['생년월일'] = parse_birth_date(row.get('생년월일'))
+            except ValueError:
+                pass  # 형식 오류 → 해당 고객만 실패 처리
+            rows.append(row)
+        return rows
+    finally:
+        wb.close()
+
+
 def process_batch(excel_path, config_path="config.json"):
     """
     엑셀 파일 일괄 처리
@@ -511,84 +834,108 @@ def process_batch(excel_path, config_path="config.json"):
         excel_path: 엑셀 파일 경로
         config_path: 설정 파일 경로
     """
-    print("=" * 60)
-    print("🚀 사주 보고서 완전 자동화 시스템")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("🚀 사주 보고서 완전 자동화 시스템")
+    logger.info("=" * 60)
     
     # 설정 로드
     config = Config(config_path)
     
     # API 키 확인
     if not config.anthropic_api_key:
-        print("[오류] Anthropic API 키가 없습니다. config.json을 확인하세요.")
+        logger.error("[오류] Anthropic API 키가 없습니다. config.json을 확인하세요.")
         return
     
     # 마스터 프롬프트 로드
-    prompt_path = os.path.join(os.path.dirname(__file__), "prompts", "00_master_prompt.txt")
-    if not os.path.exists(prompt_path):
-        prompt_path = os.path.join(os.path.dirname(__file__), "prompts", "00_마스터프롬프트.txt")
+    prompt_path = find_master_prompt_path()
     
     if not os.path.exists(prompt_path):
-        print(f"[오류] 마스터 프롬프트 파일이 없습니다: {prompt_path}")
+        logger.error("[오류] 마스터 프롬프트 파일이 없습니다: %s", prompt_path)
         return
     
-    with open(prompt_path, 'r', encoding='utf-8') as f:
-        master_prompt = f.read()
+    master_prompt = load_master_prompt(prompt_path)
     
-    print(f"✅ 마스터 프롬프트 로드 완료")
+    logger.info("✅ 마스터 프롬프트 로드 완료")
     
     # 엑셀 로드
-    df = pd.read_excel(excel_path)
-    total_customers = len(df)
-    print(f"✅ 엑셀 로드 완료: {total_customers}명")
+    rows = read_customer_rows(excel_path)
+    total_customers = len(rows)
+    logger.info("✅ 엑셀 로드 완료: %d명", total_customers)
     
     # 출력 폴더 생성
     os.makedirs(config.output_dir, exist_ok=True)
     
-    # 결과 저장
+    # Drive 서비스 (1회 인증 후 전체 고객 공유)
+    drive_service = None
+    if config.drive_folder_id and config.drive_credentials:
+        try:
+            drive_service = get_drive_service(config.drive_credentials)
+        except Exception as e:
+            logger.warning("[경고] Drive 인증 실패 (고객별 재시도): %s", e)
+    
+    # 결과 저장 [(고객번호, 결과), ...]
     results = []
     start_time = time.time()
     
-    # 고객별 처리
-    for idx, row in df.iterrows():
-        customer_num = idx + 1
-        name = row.get('이름', f'고객{customer_num}')
-        
-        print(f"\n[{customer_num}/{total_customers}] {name} 처리 시작...")
-        
-        def progress_callback(step, total, msg):
-            print(f"  → {msg}")
-        
-        result = process_customer(row, config, master_prompt, progress_callback)
-        results.append(result)
+    # 고객별 처리 (병렬)
+    def progress_callback(step, total, fmt, *args):
+        logger.info("  → " + fmt, *args)
+    
+    # 이미지 렌더링용 프로세스 풀 (배치 전체 공유, GIL 우회)
+    # 고객 스레드 풀과 함께 쓰므로 fork 대신 spawn 사용
+    if config.image_processes > 0:
+        image_pool = ProcessPoolExecutor(
+            max_workers=config.image_processes,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    else:
+        image_pool = nullcontext()
+    
+    with image_pool as image_executor, \
+            ThreadPoolExecutor(max_workers=config.parallel_customers) as executor:
+        futures = {}
+        for customer_num, row in enumerate(rows, 1):
+            name = row.get('이름', f'고객{customer_num}')
+            
+            logger.info("[%d/%d] %s 처리 시작...", customer_num, total_customers, name)
+            
+            future = executor.submit(process_customer, row, config, master_prompt, progress_callback, drive_service, image_executor)
+            futures[future] = (customer_num, name)
         
-        if result['success']:
-            print(f"  ✅ {name} 완료!")
-            if result['drive_link']:
-                print(f"     Drive: {result['drive_link']}")
-            if result['email_sent']:
-                print(f"     이메일: 발송 완료")
-        else:
-            print(f"  ❌ {name} 실패: {result['error']}")
+        for future in as_completed(futures):
+            customer_num, name = futures[future]
+            result = future.result()
+            results.append((customer_num, result))
+            
+            if result['success']:
+                logger.info("  ✅ %s 완료!", name)
+                if result['drive_link']:
+                    logger.info("     Drive: %s", result['drive_link'])
+                if result['email_sent']:
+                    logger.info("     이메일: 발송 완료")
+            else:
+                logger.error("  ❌ %s 실패: %s", name, result['error'])
+    
+    # 엑셀 순서대로 정렬
+    results = [r for _, r in sorted(results, key=lambda x: x[0])]
     
     # 결과 요약
     elapsed = time.time() - start_time
     success_count = sum(1 for r in results if r['success'])
     
-    print("\n" + "=" * 60)
-    print("📊 처리 결과")
-    print("=" * 60)
-    print(f"전체: {total_customers}명")
-    print(f"성공: {success_count}명")
-    print(f"실패: {total_customers - success_count}명")
-    print(f"소요시간: {elapsed/60:.1f}분")
-    print(f"평균: {elapsed/total_customers/60:.1f}분/명")
+    logger.info("=" * 60)
+    logger.info("📊 처리 결과")
+    logger.info("=" * 60)
+    logger.info("전체: %d명", total_customers)
+    logger.info("성공: %d명", success_count)
+    logger.info("실패: %d명", total_customers - success_count)
+    logger.info("소요시간: %.1f분", elapsed / 60)
+    logger.info("평균: %.1f분/명", elapsed / total_customers / 60)
     
     # 결과 저장
-    result_df = pd.DataFrame(results)
     result_path = os.path.join(config.output_dir, f"결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-    result_df.to_excel(result_path, index=False)
-    print(f"\n📁 결과 파일: {result_path}")
+    write_result_rows(result_path, results)
+    logger.info("📁 결과 파일: %s", result_path)
     
     return results
 
@@ -602,7 +949,7 @@ def process_single(name, birth_date, hour, minute, gender, calendar_type, is_lea
     """
     row = {
         '이름': name,
-        '생년월일': birth_date,
+        '생년월일': parse_birth_date(birth_date),
         '시': hour,
         '분': minute,
         '성별': gender,
@@ -614,15 +961,10 @@ def process_single(name, birth_date, hour, minute, gender, calendar_type, is_lea
     config = Config(config_path)
     
     # 마스터 프롬프트 로드
-    prompt_path = os.path.join(os.path.dirname(__file__), "prompts", "00_master_prompt.txt")
-    if not os.path.exists(prompt_path):
-        prompt_path = os.path.join(os.path.dirname(__file__), "prompts", "00_마스터프롬프트.txt")
-    
-    with open(prompt_path, 'r', encoding='utf-8') as f:
-        master_prompt = f.read()
+    master_prompt = load_master_prompt(find_master_prompt_path())
     
-    def progress_callback(step, total, msg):
-        print(f"[{step}/{total}] {msg}")
+    def progress_callback(step, total, fmt, *args):
+        logger.info("[%d/%d] " + fmt, step, total, *args)
     
     result = process_customer(row, config, master_prompt, progress_callback)
     
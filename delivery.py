@@ -6,17 +6,153 @@
 """
 
 import os
+import time
+import random
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from typing import Optional, List, Dict
+from email.mime.base import MIMEBase
+from email import encoders
+from typing import Optional, List, Dict, Tuple
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+
+# ============================================
+# HTTP 세션 (카카오 API 연결 재사용)
+# ============================================
+_KAKAO_SESSION = requests.Session()
+_KAKAO_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=0  # 재시도는 _post_with_retry 에서 처리
+    )
+)
+
+# (연결, 응답) 타임아웃 초
+KAKAO_TIMEOUT = (3, 10)
+
+# 재시도 대상 HTTP 상태 (요청 과다 / 일시적 서비스 불가)
+RETRY_STATUS = (429, 503)
+
+
+def _is_connect_failure(exc: requests.exceptions.ConnectionError) -> bool:
+    """요청을 보내기 전(연결 수립 단계)에 실패했는지 - DNS 실패, 연결 거부, 연결 타임아웃"""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    reason = getattr(reason, 'reason', reason)  # MaxRetryError 안의 실제 원인
+    return isinstance(reason, NewConnectionError)
+
+
+def _post_with_retry(session: requests.Session, url: str, max_attempts: int = 5,
+                     base_delay: float = 0.5, max_delay: float = 30.0, **kwargs) -> requests.Response:
+    """
+    POST + 지수 백오프 재시도 (full jitter)
+    
+    429/503 응답과 연결 수립 실패만 재시도합니다. 요청을 보낸 뒤의 오류
+    (응답 대기 중 타임아웃, 응답 읽다가 연결 끊김 등)는 서버가 이미 받았을 수 있어
+    중복 발송을 막기 위해 재시도하지 않습니다.
+    Retry-After 헤더가 있으면 그 값을 우선합니다.
+    
+    Returns:
+        마지막 응답 (재시도 소진 시 마지막 429/503 응답)
+    """
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        try:
+            response = session.post(url, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            if last_attempt or not _is_connect_failure(e):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+        else:
+            if response.status_code not in RETRY_STATUS or last_attempt:
+                return response
+            
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = min(max_delay, float(retry_after))
+            else:
+                delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+        
+        time.sleep(delay)
 
 
 # ============================================
 # 이메일 발송 (Gmail SMTP)
 # ============================================
+def _build_message(
+    to_email: str,
+    subject: str,
+    body: str,
+    sender_email: str,
+    attachments: List[str] = None,
+    drive_link: str = None,
+    html: bool = True
+) -> MIMEMultipart:
+    """
+    이메일 메시지 구성 (본문 + 드라이브 링크 + 첨부)
+    
+    Returns:
+        MIMEMultipart 메시지
+    """
+    msg = MIMEMultipart()
+    msg['From'] = sender_email
+    msg['To'] = to_email
+    msg['Subject'] = subject
+    
+    # 드라이브 링크 추가
+    if drive_link:
+        if html:
+            body += f"""
+            <br><br>
+            <hr>
+            <p><strong>📥 파일 다운로드</strong></p>
+            <p><a href="{drive_link}" target="_blank">여기를 클릭하여 파일을 다운로드하세요</a></p>
+            """
+        else:
+            body += f"\n\n---\n📥 파일 다운로드: {drive_link}"
+    
+    # 본문
+    content_type = 'html' if html else 'plain'
+    msg.attach(MIMEText(body, content_type, 'utf-8'))
+    
+    # 첨부 파일
+    if attachments:
+        for file_path in attachments:
+            if os.path.exists(file_path):
+                part = MIMEBase('application', 'octet-stream')
+                with open(file_path, 'rb') as f:
+                    part.set_payload(f.read())
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    'attachment',
+                    filename=os.path.basename(file_path)
+                )
+                msg.attach(part)
+    
+    return msg
+
+
+def _connect_smtp(sender_email: str, sender_password: str) -> smtplib.SMTP:
+    """Gmail SMTP 연결 및 로그인"""
+    server = smtplib.SMTP('smtp.gmail.com', 587)
+    try:
+        server.starttls()
+        server.login(sender_email, sender_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
 def send_email(
     to_email: str,
     subject: str,
@@ -44,45 +180,11 @@ def send_email(
         {'success': bool, 'message': str}
     """
     try:
-        msg = MIMEMultipart()
-        msg['From'] = sender_email
-        msg['To'] = to_email
-        msg['Subject'] = subject
-        
-        # 드라이브 링크 추가
-        if drive_link:
-            if html:
-                body += f"""
-                <br><br>
-                <hr>
-                <p><strong>📥 파일 다운로드</strong></p>
-                <p><a href="{drive_link}" target="_blank">여기를 클릭하여 파일을 다운로드하세요</a></p>
-                """
-            else:
-                body += f"\n\n---\n📥 파일 다운로드: {drive_link}"
-        
-        # 본문
-        content_type = 'html' if html else 'plain'
-        msg.attach(MIMEText(body, content_type, 'utf-8'))
-        
-        # 첨부 파일
-        if attachments:
-            for file_path in attachments:
-                if os.path.exists(file_path):
-                    with open(file_path, 'rb') as f:
-                        part = MIMEApplication(f.read())
-                        part.add_header(
-                            'Content-Disposition',
-                            'attachment',
-                            filename=os.path.basename(file_path)
-                        )
-                        msg.attach(part)
+        msg = _build_message(to_email, subject, body, sender_email, attachments, drive_link, html)
         
         # SMTP 연결 및 전송
-        with smtplib.SMTP('smtp.gmail.com', 587) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, to_email, msg.as_string())
+        with _connect_smtp(sender_email, sender_password) as server:
+            server.send_message(msg)
         
         return {'success': True, 'message': f'이메일 발송 완료: {to_email}'}
     
@@ -98,7 +200,7 @@ def send_bulk_emails(
     sender_password: str
 ) -> List[Dict]:
     """
-    대량 이메일 발송
+    대량 이메일 발송 (SMTP 연결 1회 재사용)
     
     Args:
         recipients: 수신자 목록
@@ -109,29 +211,45 @@ def send_bulk_emails(
         [{'email': str, 'success': bool, 'message': str}, ...]
     """
     results = []
+    server = None
     
-    for recipient in recipients:
-        email = recipient.get('email')
-        name = recipient.get('name', '고객')
-        drive_link = recipient.get('drive_link', '')
-        
-        subject = subject_template.format(name=name)
-        body = body_template.format(name=name, drive_link=drive_link)
-        
-        result = send_email(
-            to_email=email,
-            subject=subject,
-            body=body,
-            sender_email=sender_email,
-            sender_password=sender_password,
-            drive_link=drive_link
-        )
-        
-        results.append({
-            'email': email,
-            'success': result['success'],
-            'message': result['message']
-        })
+    try:
+        for recipient in recipients:
+            email = recipient.get('email')
+            name = recipient.get('name', '고객')
+            drive_link = recipient.get('drive_link', '')
+            
+            subject = subject_template.format(name=name)
+            body = body_template.format(name=name, drive_link=drive_link)
+            
+            try:
+                msg = _build_message(email, subject, body, sender_email, drive_link=drive_link)
+                
+                if server is None:
+                    server = _connect_smtp(sender_email, sender_password)
+                
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # 세션 끊김 → 재연결 후 1회 재시도
+                    server = _connect_smtp(sender_email, sender_password)
+                    server.send_message(msg)
+                
+                result = {'success': True, 'message': f'이메일 발송 완료: {email}'}
+            except Exception as e:
+                result = {'success': False, 'message': f'발송 실패: {str(e)}'}
+            
+            results.append({
+                'email': email,
+                'success': result['success'],
+                'message': result['message']
+            })
+    finally:
+        if server is not None:
+            try:
+                server.quit()
+            except smtplib.SMTPException:
+                pass
     
     return results
 
@@ -139,13 +257,63 @@ def send_bulk_emails(
 # ============================================
 # 카카오 알림톡 발송 (비즈메시지)
 # ============================================
+# 예시: NHN Cloud 알림톡/친구톡 API
+KAKAO_ALIMTALK_URL = "https://api-alimtalk.cloud.toast.com/alimtalk/v2.2/appkeys/{}/messages"
+KAKAO_FRIENDTALK_URL = "https://api-alimtalk.cloud.toast.com/friendtalk/v2.2/appkeys/{}/messages"
+
+# recipientList 1회 요청당 수신자 수
+KAKAO_BATCH_SIZE = 100
+
+
+def _kakao_headers(kakao_api_key: str) -> Dict:
+    """카카오(NHN Cloud) API 공통 헤더"""
+    return {
+        "Content-Type": "application/json;charset=UTF-8",
+        "X-Secret-Key": kakao_api_key
+    }
+
+
+def _kakao_send_ok(response, result: Dict) -> bool:
+    """
+    단건 발송 성공 여부
+    
+    NHN 은 발송 실패도 HTTP 200 + header.isSuccessful=false 로 돌려주므로 본문을 확인합니다.
+    수신자별 결과(sendResults)가 있으면 resultCode 0 이어야 성공입니다.
+    """
+    if response.status_code != 200 or not (result.get('header') or {}).get('isSuccessful'):
+        return False
+    send_results = (result.get('message') or {}).get('sendResults') or []
+    return all(sr.get('resultCode') == 0 for sr in send_results)
+
+
+def _friendtalk_recipient(to_phone: str, message: str, button_link: str = None, button_text: str = "파일 다운로드") -> Dict:
+    """친구톡 recipientList 항목 생성"""
+    recipient = {
+        "recipientNo": to_phone,
+        "content": message
+    }
+    
+    # 버튼 추가
+    if button_link:
+        recipient["buttons"] = [{
+            "ordering": 1,
+            "type": "WL",
+            "name": button_text,
+            "linkMo": button_link,
+            "linkPc": button_link
+        }]
+    
+    return recipient
+
+
 def send_kakao_alimtalk(
     to_phone: str,
     template_code: str,
     template_data: Dict,
     kakao_api_key: str,
     sender_key: str,
-    profile_key: str = None
+    profile_key: str = None,
+    verbose: bool = False
 ) -> Dict:
     """
     카카오 알림톡 발송 (비즈메시지 API)
@@ -159,20 +327,17 @@ def send_kakao_alimtalk(
         kakao_api_key: API 키
         sender_key: 발신 프로필 키
         profile_key: 프로필 키 (선택)
+        verbose: 성공 시에도 message/response 포함 (기본은 {'success': True} 만 반환)
         
     Returns:
         {'success': bool, 'message': str, 'response': dict}
+        (성공 + verbose=False 이면 {'success': True})
     """
     # ※ 실제 구현은 사용하는 알림톡 서비스에 따라 다름
     # 예: NHN Cloud, 인포뱅크, 다우기술 등
     
-    # 예시: NHN Cloud 알림톡 API
-    url = "https://api-alimtalk.cloud.toast.com/alimtalk/v2.2/appkeys/{}/messages".format(kakao_api_key)
-    
-    headers = {
-        "Content-Type": "application/json;charset=UTF-8",
-        "X-Secret-Key": kakao_api_key
-    }
+    url = KAKAO_ALIMTALK_URL.format(kakao_api_key)
+    headers = _kakao_headers(kakao_api_key)
     
     data = {
         "senderKey": sender_key,
@@ -184,10 +349,12 @@ def send_kakao_alimtalk(
     }
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = _post_with_retry(_KAKAO_SESSION, url, headers=headers, json=data, timeout=KAKAO_TIMEOUT)
         result = response.json()
         
-        if response.status_code == 200:
+        if _kakao_send_ok(response, result):
+            if not verbose:
+                return {'success': True}
             return {
                 'success': True,
                 'message': f'알림톡 발송 완료: {to_phone}',
@@ -213,7 +380,8 @@ def send_kakao_friendtalk(
     kakao_api_key: str,
     sender_key: str,
     button_link: str = None,
-    button_text: str = "파일 다운로드"
+    button_text: str = "파일 다운로드",
+    verbose: bool = False
 ) -> Dict:
     """
     카카오 친구톡 발송 (친구 추가된 사용자에게만)
@@ -225,44 +393,29 @@ def send_kakao_friendtalk(
         sender_key: 발신 프로필 키
         button_link: 버튼 링크 URL
         button_text: 버튼 텍스트
+        verbose: 성공 시에도 message 포함 (기본은 {'success': True} 만 반환)
         
     Returns:
         {'success': bool, 'message': str}
+        (성공 + verbose=False 이면 {'success': True})
     """
     # ※ 실제 구현은 사용하는 서비스에 따라 다름
     
-    url = "https://api-alimtalk.cloud.toast.com/friendtalk/v2.2/appkeys/{}/messages".format(kakao_api_key)
-    
-    headers = {
-        "Content-Type": "application/json;charset=UTF-8",
-        "X-Secret-Key": kakao_api_key
-    }
-    
-    recipient = {
-        "recipientNo": to_phone,
-        "content": message
-    }
-    
-    # 버튼 추가
-    if button_link:
-        recipient["buttons"] = [{
-            "ordering": 1,
-            "type": "WL",
-            "name": button_text,
-            "linkMo": button_link,
-            "linkPc": button_link
-        }]
+    url = KAKAO_FRIENDTALK_URL.format(kakao_api_key)
+    headers = _kakao_headers(kakao_api_key)
     
     data = {
         "senderKey": sender_key,
-        "recipientList": [recipient]
+        "recipientList": [_friendtalk_recipient(to_phone, message, button_link, button_text)]
     }
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = _post_with_retry(_KAKAO_SESSION, url, headers=headers, json=data, timeout=KAKAO_TIMEOUT)
         result = response.json()
         
-        if response.status_code == 200:
+        if _kakao_send_ok(response, result):
+            if not verbose:
+                return {'success': True}
             return {'success': True, 'message': f'친구톡 발송 완료: {to_phone}'}
         else:
             return {'success': False, 'message': f'발송 실패: {result}'}
@@ -270,6 +423,209 @@ def send_kakao_friendtalk(
         return {'success': False, 'message': f'발송 오류: {str(e)}'}
 
 
+def _chunked(items: List, size: int):
+    """리스트를 size 개씩 나눔"""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _post_recipient_list(url: str, headers: Dict, data: Dict, recipient_list: List[Dict]) -> Tuple[bool, Dict[str, Dict]]:
+    """
+    recipientList 1회 POST
+    
+    Returns:
+        (요청 성공 여부, {전화번호: {'success': bool, 'message': str}})
+    """
+    try:
+        response = _post_with_retry(
+            _KAKAO_SESSION, url, headers=headers, json={**data, "recipientList": recipient_list}, timeout=KAKAO_TIMEOUT
+        )
+        result = response.json()
+    except Exception as e:
+        return False, {
+            r["recipientNo"]: {'success': False, 'message': f'발송 오류: {str(e)}'}
+            for r in recipient_list
+        }
+    
+    # HTTP 200 이어도 요청 단위 오류(템플릿/발신 키 오류 등)는 header.isSuccessful=false 로 옴
+    header = result.get('header') or {}
+    if response.status_code != 200 or not header.get('isSuccessful'):
+        return False, {
+            r["recipientNo"]: {'success': False, 'message': f'발송 실패: {result}'}
+            for r in recipient_list
+        }
+    
+    # 수신자별 결과 (resultCode 0 = 성공)
+    by_phone = {}
+    send_results = (result.get('message') or {}).get('sendResults') or []
+    for sr in send_results:
+        by_phone[sr.get('recipientNo')] = {
+            'success': sr.get('resultCode') == 0,
+            'message': sr.get('resultMessage', '')
+        }
+    
+    # 개별 결과가 없는 수신자는 발송을 확인할 수 없으므로 실패로 처리
+    for r in recipient_list:
+        by_phone.setdefault(r["recipientNo"], {'success': False, 'message': '발송 결과 없음'})
+    
+    return True, by_phone
+
+
+def _send_in_batches(url: str, headers: Dict, data: Dict, recipient_list: List[Dict], batch_size: int, max_workers: int):
+    """
+    recipientList를 batch_size 단위로 나눠 동시 POST
+    
+    요청은 성공했지만 개별 실패한 수신자는 1명씩 재시도하며,
+    재시도도 응답의 resultCode 로 발송을 확인합니다.
+    
+    Returns:
+        {전화번호: {'success': bool, 'message': str}}
+    """
+    chunks = list(_chunked(recipient_list, batch_size))
+    results = {}
+    retryable = set()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_ok, by_phone in executor.map(
+            lambda chunk: _post_recipient_list(url, headers, data, chunk), chunks
+        ):
+            results.update(by_phone)
+            if chunk_ok:
+                retryable.update(phone for phone, r in by_phone.items() if not r['success'])
+    
+    # 개별 실패 재시도
+    for r in recipient_list:
+        if r["recipientNo"] in retryable:
+            _, by_phone = _post_recipient_list(url, headers, data, [r])
+            results.update(by_phone)
+    
+    return results
+
+
+def send_kakao_alimtalk_batch(
+    recipients: List[Tuple[str, Dict]],  # [(전화번호, 템플릿변수), ...]
+    template_code: str,
+    kakao_api_key: str,
+    sender_key: str,
+    batch_size: int = KAKAO_BATCH_SIZE,
+    max_workers: int = 4
+) -> Dict[str, Dict]:
+    """
+    알림톡 일괄 발송 (요청 1회에 최대 batch_size 명)
+    
+    요청은 성공했지만 개별 실패한 수신자는 1명씩 재시도합니다.
+    
+    Returns:
+        {전화번호: {'success': bool, 'message': str}}
+    """
+    url = KAKAO_ALIMTALK_URL.format(kakao_api_key)
+    headers = _kakao_headers(kakao_api_key)
+    data = {
+        "senderKey": sender_key,
+        "templateCode": template_code
+    }
+    recipient_list = [
+        {"recipientNo": phone, "templateParameter": template_data}
+        for phone, template_data in recipients
+    ]
+    
+    return _send_in_batches(url, headers, data, recipient_list, batch_size, max_workers)
+
+
+def send_kakao_friendtalk_batch(
+    recipients: List[Tuple[str, str, Optional[str]]],  # [(전화번호, 메시지, 버튼링크), ...]
+    kakao_api_key: str,
+    sender_key: str,
+    button_text: str = "파일 다운로드",
+    batch_size: int = KAKAO_BATCH_SIZE,
+    max_workers: int = 4
+) -> Dict[str, Dict]:
+    """
+    친구톡 일괄 발송 (요청 1회에 최대 batch_size 명)
+    
+    요청은 성공했지만 개별 실패한 수신자는 1명씩 재시도합니다.
+    
+    Returns:
+        {전화번호: {'success': bool, 'message': str}}
+    """
+    url = KAKAO_FRIENDTALK_URL.format(kakao_api_key)
+    headers = _kakao_headers(kakao_api_key)
+    data = {"senderKey": sender_key}
+    recipient_list = [
+        _friendtalk_recipient(phone, message, button_link, button_text)
+        for phone, message, button_link in recipients
+    ]
+    
+    return _send_in_batches(url, headers, data, recipient_list, batch_size, max_workers)
+
+
+def send_bulk_kakao_alimtalk(
+    recipients: List[Dict],  # [{'phone': str, 'template_data': dict}, ...]
+    template_code: str,
+    kakao_api_key: str,
+    sender_key: str,
+    max_workers: int = 4
+) -> List[Dict]:
+    """
+    대량 알림톡 발송 (recipientList 일괄 요청)
+    
+    Args:
+        recipients: 수신자 목록
+        template_code: 승인된 템플릿 코드
+        max_workers: 동시 요청 수
+        
+    Returns:
+        [{'phone': str, 'success': bool, 'message': str}, ...] (입력 순서)
+    """
+    results = send_kakao_alimtalk_batch(
+        [(r.get('phone'), r.get('template_data', {})) for r in recipients],
+        template_code=template_code,
+        kakao_api_key=kakao_api_key,
+        sender_key=sender_key,
+        max_workers=max_workers
+    )
+    
+    return [
+        {'phone': r.get('phone'), **results[r.get('phone')]}
+        for r in recipients
+    ]
+
+
+def send_bulk_kakao_friendtalk(
+    recipients: List[Dict],  # [{'phone': str, 'message': str, 'button_link': str}, ...]
+    kakao_api_key: str,
+    sender_key: str,
+    button_text: str = "파일 다운로드",
+    max_workers: int = 4
+) -> List[Dict]:
+    """
+    대량 친구톡 발송 (recipientList 일괄 요청)
+    
+    Args:
+        recipients: 수신자 목록
+        max_workers: 동시 요청 수
+        
+    Returns:
+        [{'phone': str, 'success': bool, 'message': str}, ...] (입력 순서)
+    """
+    results = send_kakao_friendtalk_batch(
+        [(r.get('phone'), r.get('message', ''), r.get('button_link')) for r in recipients],
+        kakao_api_key=kakao_api_key,
+        sender_key=sender_key,
+        button_text=button_text,
+        max_workers=max_workers
+    )
+    
+    return [
+        {'phone': r.get('phone'), **results[r.get('phone')]}
+        for r in recipients
+    ]
+
+
 # ============================================
 # 이메일 템플릿
 # ============================================
@@ -8,15 +8,113 @@
 
 import os
 import json
-from typing import Optional, Dict
+import threading
+from functools import lru_cache
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import httplib2
+    import google_auth_httplib2
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+    from googleapiclient.http import HttpRequest, MediaFileUpload
+    _HAS_GOOGLE = True
+except ImportError:
+    _HAS_GOOGLE = False
+
+
+DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive']
+
+# 429 / 5xx / 403 rateLimitExceeded 재시도 횟수
+# (googleapiclient 내장 지수 백오프 + jitter 사용)
+DRIVE_NUM_RETRIES = 5
+
+# 재개 가능 업로드 청크 크기 (256KB 배수여야 함)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 동시 업로드 상한 (사용자당 QPS 제한 대응, 호출 스레드 수와 무관하게 적용)
+DRIVE_MAX_CONCURRENT_UPLOADS = 8
+_upload_semaphore = threading.BoundedSemaphore(DRIVE_MAX_CONCURRENT_UPLOADS)
+
+
+def _require_google():
+    if not _HAS_GOOGLE:
+        raise ImportError("google-api-python-client, google-auth 설치 필요")
+
+
+def _load_credentials(credentials_json: str):
+    """서비스 계정 인증 정보 (JSON 문자열 또는 파일 경로)"""
+    if os.path.exists(credentials_json):
+        return service_account.Credentials.from_service_account_file(
+            credentials_json, scopes=DRIVE_SCOPES
+        )
+    return service_account.Credentials.from_service_account_info(
+        json.loads(credentials_json), scopes=DRIVE_SCOPES
+    )
+
+
+def build_drive_service(credentials_json: str):
+    """
+    Drive 서비스 생성 (여러 업로드에서 재사용)
+    
+    스레드별 httplib2.Http 를 쓰도록 requestBuilder 를 지정하므로
+    같은 서비스 객체를 여러 스레드에서 동시에 사용해도 안전합니다.
+    인증(credentials)은 한 번만 수행되고 토큰은 공유됩니다.
+    
+    Args:
+        credentials_json: 서비스 계정 JSON 문자열 또는 파일 경로
+        
+    Returns:
+        googleapiclient Drive v3 서비스
+    """
+    _require_google()
+    credentials = _load_credentials(credentials_json)
+    
+    local = threading.local()
+    
+    def build_request(http, *args, **kwargs):
+        # httplib2.Http 는 스레드 안전하지 않으므로 스레드마다 하나씩 두고 재사용
+        # (같은 스레드의 후속 요청은 keep-alive 연결을 그대로 사용해 TLS 핸드셰이크 생략)
+        thread_http = getattr(local, 'http', None)
+        if thread_http is None:
+            thread_http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+            local.http = thread_http
+        return HttpRequest(thread_http, *args, **kwargs)
+    
+    authorized_http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+    return build(
+        'drive', 'v3',
+        requestBuilder=build_request,
+        http=authorized_http,
+        cache_discovery=False  # 번들된 discovery 문서 사용, 파일 캐시 경고 방지
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_drive_service(creds_key: str):
+    """인증 정보별 Drive 서비스 캐시 (creds_key: 절대 경로 또는 JSON 문자열)"""
+    return build_drive_service(creds_key)
+
+
+def get_drive_service(credentials_json: str):
+    """
+    캐시된 Drive 서비스 반환
+    
+    같은 인증 정보로 여러 번 호출해도 인증/서비스 생성은 한 번만 수행됩니다.
+    """
+    if os.path.exists(credentials_json):
+        credentials_json = os.path.abspath(credentials_json)
+    return _get_drive_service(credentials_json)
 
 
 def upload_to_drive(
     file_path: str,
     folder_id: str,
-    credentials_json: str,
+    credentials_json: str = None,
     file_name: str = None,
-    make_public: bool = True
+    make_public: bool = True,
+    service=None
 ) -> Dict:
     """
     Google Drive에 파일 업로드
@@ -27,31 +125,15 @@ def upload_to_drive(
         credentials_json: 서비스 계정 JSON 문자열 또는 파일 경로
         file_name: 드라이브에 저장할 파일명 (없으면 원본 파일명)
         make_public: 공개 링크 생성 여부
+        service: build_drive_service()로 미리 만든 서비스 (있으면 인증 생략)
         
     Returns:
         {'file_id': str, 'web_link': str, 'download_link': str}
     """
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaFileUpload
-    except ImportError:
-        raise ImportError("google-api-python-client, google-auth 설치 필요")
-    
-    # 인증
-    if os.path.exists(credentials_json):
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_json,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
-    else:
-        creds_dict = json.loads(credentials_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            creds_dict,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
+    _require_google()
     
-    service = build('drive', 'v3', credentials=credentials)
+    if service is None:
+        service = get_drive_service(credentials_json)
     
     # 파일명
     if file_name is None:
@@ -75,23 +157,27 @@ def upload_to_drive(
     ext = os.path.splitext(file_path)[1].lower()
     mime_type = mime_types.get(ext, 'application/octet-stream')
     
-    # 업로드
-    media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
-    file = service.files().create(
-        body=file_metadata,
-        media_body=media,
-        fields='id, webViewLink'
-    ).execute()
-    
-    file_id = file.get('id')
-    web_link = file.get('webViewLink')
-    
-    # 공개 권한 설정
-    if make_public:
-        service.permissions().create(
-            fileId=file_id,
-            body={'type': 'anyone', 'role': 'reader'}
-        ).execute()
+    # 업로드 (청크 단위 재개 가능 업로드, 청크마다 백오프 재시도)
+    media = MediaFileUpload(file_path, mimetype=mime_type, chunksize=UPLOAD_CHUNK_SIZE, resumable=True)
+    with _upload_semaphore:
+        request = service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id, webViewLink'
+        )
+        file = None
+        while file is None:
+            _, file = request.next_chunk(num_retries=DRIVE_NUM_RETRIES)
+        
+        file_id = file.get('id')
+        web_link = file.get('webViewLink')
+        
+        # 공개 권한 설정
+        if make_public:
+            service.permissions().create(
+                fileId=file_id,
+                body={'type': 'anyone', 'role': 'reader'}
+            ).execute(num_retries=DRIVE_NUM_RETRIES)
     
     # 다운로드 링크
     download_link = f"https://drive.google.com/uc?export=download&id={file_id}"
@@ -103,6 +189,46 @@ def upload_to_drive(
     }
 
 
+def upload_many_to_drive(
+    file_paths: List[str],
+    folder_id: str,
+    credentials_json: str = None,
+    make_public: bool = True,
+    service=None,
+    max_workers: int = DRIVE_MAX_CONCURRENT_UPLOADS
+) -> List[Dict]:
+    """
+    여러 파일을 동시에 Google Drive에 업로드
+    
+    Args:
+        file_paths: 업로드할 파일 경로 리스트
+        max_workers: 동시 업로드 스레드 수
+        (나머지는 upload_to_drive 와 동일)
+        
+    Returns:
+        입력 순서대로 [{'file_path', 'success', 'file_id', 'web_link', 'download_link', 'error'}, ...]
+    """
+    if service is None:
+        service = get_drive_service(credentials_json)
+    
+    def upload_one(file_path):
+        try:
+            result = upload_to_drive(file_path, folder_id, make_public=make_public, service=service)
+            return {'file_path': file_path, 'success': True, **result, 'error': None}
+        except Exception as e:
+            return {
+                'file_path': file_path, 'success': False,
+                'file_id': None, 'web_link': None, 'download_link': None,
+                'error': str(e)
+            }
+    
+    if not file_paths:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(upload_one, file_paths))
+
+
 def create_folder(
     folder_name: str,
     parent_folder_id: str,
@@ -114,26 +240,7 @@ def create_folder(
     Returns:
         생성된 폴더 ID
     """
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError("google-api-python-client, google-auth 설치 필요")
-    
-    # 인증
-    if os.path.exists(credentials_json):
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_json,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
-    else:
-        creds_dict = json.loads(credentials_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            creds_dict,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
-    
-    service = build('drive', 'v3', credentials=credentials)
+    service = get_drive_service(credentials_json)
     
     file_metadata = {
         'name': folder_name,
@@ -141,7 +248,7 @@ def create_folder(
         'parents': [parent_folder_id]
     }
     
-    folder = service.files().create(body=file_metadata, fields='id').execute()
+    folder = service.files().create(body=file_metadata, fields='id').execute(num_retries=DRIVE_NUM_RETRIES)
     return folder.get('id')
 
 
@@ -155,30 +262,12 @@ def list_files_in_folder(
     Returns:
         [{'id': str, 'name': str, 'mimeType': str}, ...]
     """
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError("google-api-python-client, google-auth 설치 필요")
-    
-    if os.path.exists(credentials_json):
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_json,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
-    else:
-        creds_dict = json.loads(credentials_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            creds_dict,
-            scopes=['https://www.googleapis.com/auth/drive']
-        )
-    
-    service = build('drive', 'v3', credentials=credentials)
+    service = get_drive_service(credentials_json)
     
     results = service.files().list(
         q=f"'{folder_id}' in parents",
         fields="files(id, name, mimeType)"
-    ).execute()
+    ).execute(num_retries=DRIVE_NUM_RETRIES)
     
     return results.get('files', [])
 
@@ -9,6 +9,14 @@
 import os
 import io
 import re
+import glob
+import mmap
+import struct
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+from itertools import accumulate
+from bisect import bisect_left
 from typing import Dict, List, Tuple, Optional, Callable
 
 from docx import Document
@@ -20,18 +28,67 @@ from reportlab.lib.utils import ImageReader
 from PIL import Image
 
 
+# ============================================
+# 본문 패턴
+# ============================================
+_IMG_TAG_RE = re.compile(r'\{\{IMG:([^}]+)\}\}')
+_CHAPTER_RE = re.compile(r'제.{0,8}장', re.S)      # "제"로 시작하고 앞 10자 안에 "장"
+_SUBTITLE_PREFIXES = ('▶', '●', '◆', '★', '■', '□', '○')
+
+# 이미지 파일명 분류 (앞쪽 분기가 우선 - 위치가 아니라 순서대로 판정)
+_CLASSIFY_RE = re.compile(
+    r'(?=.*(?:표지|cover))(?P<cover>)'
+    r'|(?=.*(?:장배경|chapter))(?P<chapter_bg>)'
+    r'|(?=.*(?:내지|bg|page))(?P<page_bg>)'
+    r'|(?=.*(?:목차|toc))(?P<toc>)'
+    r'|(?=.*(?:안내|guide))(?P<guide>)',
+    re.S
+)
+
+
 # ============================================
 # 전역 폰트 변수
 # ============================================
 FONT_NAME = 'Helvetica'
 BOLD_NAME = 'Helvetica-Bold'
 FONT_LOADED = False
+_LOADED_FONTS_DIR = None  # 현재 등록된 폰트를 찾은 fonts 폴더
+
+
+# 시스템 한글 폰트 후보 (우선순위 순)
+SYSTEM_FONTS = (
+    'C:/Windows/Fonts/NanumGothic.ttf',
+    'C:/Windows/Fonts/malgun.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+)
+
+
+def _register_korean_font(font_paths) -> bool:
+    """후보 경로를 순서대로 시도해 처음 등록되는 폰트 사용"""
+    global FONT_NAME, BOLD_NAME, FONT_LOADED
+    
+    for path in font_paths:
+        try:
+            pdfmetrics.registerFont(TTFont('Korean', path))
+            pdfmetrics.registerFont(TTFont('KoreanBold', path))
+        except Exception:
+            continue
+        FONT_NAME = 'Korean'
+        BOLD_NAME = 'KoreanBold'
+        FONT_LOADED = True
+        _char_widths.cache_clear()  # 같은 폰트명으로 다른 파일이 등록될 수 있음
+        return True
+    
+    return False
 
 
 def setup_fonts(fonts_dir: str = None, system_fonts: List[str] = None) -> Tuple[str, str]:
     """
     한글 폰트 설정
     
+    처음 호출될 때 등록하고 이후에는 바로 반환합니다.
+    fonts_dir 를 지정하면 이전과 다른 폴더일 때 그 폴더의 폰트로 다시 등록합니다.
+    
     Args:
         fonts_dir: 폰트 폴더 경로 (없으면 현재 폴더/fonts)
         system_fonts: 시스템 폰트 경로 리스트
@@ -39,9 +96,9 @@ def setup_fonts(fonts_dir: str = None, system_fonts: List[str] = None) -> Tuple[
     Returns:
         (일반폰트명, 볼드폰트명) 튜플
     """
-    global FONT_NAME, BOLD_NAME, FONT_LOADED
+    global _LOADED_FONTS_DIR
     
-    if FONT_LOADED:
+    if FONT_LOADED and (fonts_dir is None or fonts_dir == _LOADED_FONTS_DIR):
         return FONT_NAME, BOLD_NAME
     
     # 기본 fonts 폴더
@@ -49,34 +106,10 @@ def setup_fonts(fonts_dir: str = None, system_fonts: List[str] = None) -> Tuple[
         script_dir = os.path.dirname(os.path.abspath(__file__))
         fonts_dir = os.path.join(script_dir, 'fonts')
     
-    # 폰트 파일 수집
-    font_files = []
-    if os.path.exists(fonts_dir):
-        for f in os.listdir(fonts_dir):
-            if f.lower().endswith('.ttf'):
-                font_files.append(os.path.join(fonts_dir, f))
-    
-    # 시스템 폰트
-    if system_fonts is None:
-        system_fonts = [
-            'C:/Windows/Fonts/NanumGothic.ttf',
-            'C:/Windows/Fonts/malgun.ttf',
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-        ]
-    
-    all_fonts = font_files + system_fonts
-    
-    for path in all_fonts:
-        if os.path.exists(path):
-            try:
-                pdfmetrics.registerFont(TTFont('Korean', path))
-                pdfmetrics.registerFont(TTFont('KoreanBold', path))
-                FONT_NAME = 'Korean'
-                BOLD_NAME = 'KoreanBold'
-                FONT_LOADED = True
-                return FONT_NAME, BOLD_NAME
-            except Exception:
-                continue
+    # fonts 폴더의 TTF (이름순) → 시스템 폰트
+    font_files = sorted(glob.iglob(os.path.join(glob.escape(fonts_dir), '*.[tT][tT][fF]')))
+    if _register_korean_font(font_files + list(system_fonts or SYSTEM_FONTS)):
+        _LOADED_FONTS_DIR = fonts_dir
     
     return FONT_NAME, BOLD_NAME
 
@@ -104,7 +137,44 @@ def read_docx(file_path_or_buffer) -> List[Dict]:
         return []
 
 
-def classify_images(images: Dict[str, bytes]) -> Dict:
+class LazyImageStore(Mapping):
+    """
+    {파일명: 이미지데이터} 지연 로딩 매핑
+    
+    값은 파일을 메모리 매핑(mmap)한 읽기 전용 버퍼라서, 실제로 그려지는
+    이미지의 페이지만 OS가 읽어 들입니다. 모든 이미지를 미리 read() 해서
+    메모리에 올려 두지 않으므로 이미지가 많아도 메모리 사용량이 작습니다.
+    """
+    
+    def __init__(self, paths: List[str]):
+        self._paths = {os.path.basename(p): p for p in paths}
+    
+    def __getitem__(self, name):
+        path = self._paths[name]
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def __iter__(self):
+        return iter(self._paths)
+    
+    def __len__(self):
+        return len(self._paths)
+
+
+def read_docx_files(docx_paths: List[str]) -> List[Tuple[str, List[Dict]]]:
+    """
+    여러 Docx 파일 읽기 (파일명 순)
+    
+    Returns:
+        [(파일명, 내용리스트), ...] - 내용이 빈 파일은 제외
+    """
+    pairs = ((os.path.basename(path), read_docx(path)) for path in sorted(docx_paths))
+    return [(name, content) for name, content in pairs if content]
+
+
+def classify_images(images: Mapping) -> Dict:
     """
     이미지 분류 (표지, 내지, 장배경, 목차, 안내, 사주표)
     
@@ -124,84 +194,223 @@ def classify_images(images: Dict[str, bytes]) -> Dict:
     }
     
     for name, data in images.items():
-        name_lower = name.lower()
+        m = _CLASSIFY_RE.match(name.lower())
+        kind = m.lastgroup if m else 'tables'
         
-        if "표지" in name or "cover" in name_lower:
-            result['cover'] = data
-        elif "장배경" in name or "chapter" in name_lower:
-            result['chapter_bg'] = data
-        elif "내지" in name or "bg" in name_lower or "page" in name_lower:
-            result['page_bg'] = data
-        elif "목차" in name or "toc" in name_lower:
-            result['toc'].append((name, data))
-        elif "안내" in name or "guide" in name_lower:
-            result['guide'].append((name, data))
-        else:
+        if kind in ('toc', 'guide'):
+            result[kind].append((name, data))
+        elif kind == 'tables':
             # 사주표 이미지
             result['tables'][name] = data
+        else:
+            result[kind] = data
     
     # 정렬
-    result['toc'].sort(key=lambda x: x[0])
-    result['guide'].sort(key=lambda x: x[0])
+    result['toc'].sort(key=itemgetter(0))
+    result['guide'].sort(key=itemgetter(0))
     
     return result
 
 
-def find_image_by_tag(text: str, images_dict: Dict[str, bytes]) -> Tuple[str, bytes, str]:
+def build_tag_index(images_dict: Mapping) -> Dict[str, Optional[str]]:
+    """
+    태그명 → 파일명 색인 (파일명 / 확장자 뺀 이름 정확히 일치)
+    
+    부분 일치는 find_image_by_tag 에서 처음 조회될 때 한 번만 찾아 기록합니다.
+    """
+    index = {}
+    for img_name in images_dict:
+        index.setdefault(img_name, img_name)
+        index.setdefault(os.path.splitext(img_name)[0], img_name)
+    return index
+
+
+def find_image_by_tag(
+    text: str,
+    images_dict: Mapping,
+    tag_index: Dict[str, Optional[str]] = None
+) -> Tuple[str, bytes, str]:
     """
     {{IMG:태그명}} 형식에서 이미지 찾기
     
+    Args:
+        text: 문단 텍스트
+        images_dict: {파일명: 이미지데이터}
+        tag_index: build_tag_index()로 만든 색인 (여러 번 조회할 때 재사용)
+    
     Returns:
         (태그명, 이미지데이터, 파일명) 또는 (태그명, None, None)
     """
-    pattern = re.compile(r'\{\{IMG:([^}]+)\}\}')
-    match = pattern.search(text)
+    match = _IMG_TAG_RE.search(text)
     
     if not match:
         return (None, None, None)
     
     tag_name = match.group(1).strip()
     
-    for img_name, img_data in images_dict.items():
-        # 파일명에서 확장자 제거
-        img_base = os.path.splitext(img_name)[0]
-        
-        # 매칭 조건
-        if (tag_name == img_name or 
-            tag_name == img_base or
-            tag_name in img_name or
-            img_base.endswith(tag_name)):
-            return (tag_name, img_data, img_name)
+    if tag_index is None:
+        tag_index = build_tag_index(images_dict)
+    
+    if tag_name not in tag_index:
+        # 부분 일치 (확장자 뺀 이름의 끝부분 일치도 포함됨)
+        tag_index[tag_name] = next((name for name in images_dict if tag_name in name), None)
+    
+    img_name = tag_index[tag_name]
+    if img_name is None:
+        return (tag_name, None, None)
+    
+    return (tag_name, images_dict[img_name], img_name)
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG SOFn 마커 (DHT=C4, JPG=C8, DAC=CC 제외)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _image_size(data) -> Tuple[int, int]:
+    """
+    이미지 헤더에서 (가로, 세로) 픽셀 크기 읽기 (PNG IHDR / JPEG SOFn)
+    
+    픽셀 디코딩 없이 크기만 필요할 때 사용합니다. 그 외 형식은 PIL 로 읽습니다.
+    """
+    if data[:8] == _PNG_SIGNATURE:
+        return struct.unpack('>II', data[16:24])
+    
+    if data[:2] == b'\xff\xd8':
+        pos = 2
+        size = len(data)
+        while pos + 9 <= size:
+            if data[pos] != 0xFF:
+                break
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                # 채움 바이트
+                pos += 1
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                h, w = struct.unpack('>HH', data[pos + 5:pos + 9])
+                return w, h
+            pos += 2 + struct.unpack('>H', data[pos + 2:pos + 4])[0]
     
-    return (tag_name, None, None)
+    return Image.open(io.BytesIO(data)).size
+
+
+# PDF에 넣을 이미지 해상도 (그려질 크기 기준, 이보다 큰 원본은 줄여서 넣음)
+IMAGE_DPI = 150
+
+
+def _prepare_image(data, max_w_pt: float, max_h_pt: float, dpi: int = IMAGE_DPI) -> Tuple[bytes, int, int]:
+    """
+    그려질 최대 크기에 맞춰 이미지 축소
+    
+    reportlab 은 그리는 크기와 상관없이 원본 픽셀을 그대로 PDF에 넣으므로,
+    큰 원본은 미리 줄여야 PDF 용량과 렌더링 시간이 줄어듭니다.
+    원본이 충분히 작으면 헤더만 읽고 그대로 반환합니다.
+    
+    Returns:
+        (이미지데이터, 가로px, 세로px)
+    """
+    img_w, img_h = _image_size(data)
+    max_w_px = int(max_w_pt * dpi / 72)
+    max_h_px = int(max_h_pt * dpi / 72)
+    
+    if img_w <= max_w_px and img_h <= max_h_px:
+        return data, img_w, img_h
+    
+    img = Image.open(io.BytesIO(data))
+    is_jpeg = img.format == 'JPEG'
+    img.thumbnail((max_w_px, max_h_px), Image.LANCZOS)
+    
+    out = io.BytesIO()
+    if is_jpeg:
+        img.save(out, 'JPEG', quality=85, optimize=True)
+    else:
+        # 사주표 등 선/글자 이미지는 무손실 유지
+        img.save(out, 'PNG', optimize=True)
+    
+    return out.getvalue(), img.width, img.height
+
+
+def _image_reader(data, max_w_pt: float, max_h_pt: float) -> Optional[ImageReader]:
+    """이미지 데이터 → 축소된 ImageReader (없거나 읽을 수 없으면 None)"""
+    if not data:
+        return None
+    try:
+        data, _, _ = _prepare_image(data, max_w_pt, max_h_pt)
+        return ImageReader(io.BytesIO(data))
+    except Exception:
+        return None
+
+
+class _CharWidths(dict):
+    """문자 → 폭(pt) 캐시. 처음 보는 문자만 폰트 메트릭을 조회합니다."""
+    
+    def __init__(self, font_name: str, font_size: float):
+        super().__init__()
+        self.font_name = font_name
+        self.font_size = font_size
+    
+    def __missing__(self, char):
+        width = self[char] = pdfmetrics.stringWidth(char, self.font_name, self.font_size)
+        return width
+
+
+@lru_cache(maxsize=16)
+def _char_widths(font_name: str, font_size: float) -> _CharWidths:
+    return _CharWidths(font_name, font_size)
+
+
+def wrap_text(text: str, font_name: str, font_size: float, max_width: float) -> List[str]:
+    """
+    최대 너비에 맞춰 글자 단위 줄바꿈
+    
+    문자별 폭의 누적합을 한 번 만들고, 줄마다 끊을 위치를 이진 탐색으로 찾습니다.
+    (폭 계산/탐색이 accumulate, bisect 의 C 구현에서 수행됨)
+    """
+    widths = _char_widths(font_name, font_size)
+    cum = list(accumulate(map(widths.__getitem__, text)))
+    lines = []
+    start = 0
+    
+    while start < len(text):
+        line_start_width = cum[start - 1] if start else 0.0
+        end = bisect_left(cum, line_start_width + max_width, start)
+        if end == start:
+            # 한 글자가 최대 너비보다 넓으면 그 글자만 한 줄로
+            end = start + 1
+        lines.append(text[start:end])
+        start = end
+    
+    return lines
 
 
 def create_pdf(
     docx_contents: List[Tuple[str, List[Dict]]],  # [(파일명, 내용), ...]
-    images: Dict[str, bytes],  # {파일명: 바이트}
+    images: Mapping,  # {파일명: 바이트} 또는 LazyImageStore
     customer_name: str,
     output_path: str = None,
     progress_callback: Callable[[float, str], None] = None,
     fonts_dir: str = None
-) -> io.BytesIO:
+) -> Optional[io.BytesIO]:
     """
     PDF 생성 메인 함수
     
     Args:
         docx_contents: [(파일명, 내용리스트), ...] - 장별 Docx 내용
-        images: {파일명: 바이트데이터} - 모든 이미지
+        images: {파일명: 바이트데이터} - 모든 이미지 (LazyImageStore 가능)
         customer_name: 고객 이름
-        output_path: 저장 경로 (없으면 BytesIO 반환)
+        output_path: 저장 경로 (있으면 파일에 바로 기록, 없으면 BytesIO 반환)
         progress_callback: 진행상황 콜백 (progress, status_text)
         fonts_dir: 폰트 폴더 경로
         
     Returns:
-        PDF BytesIO 버퍼
+        PDF BytesIO 버퍼 (output_path 지정 시 None)
     """
     font_name, bold_name = setup_fonts(fonts_dir)
     
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
+    # 저장 경로가 있으면 파일에 바로 기록 (BytesIO 복사 생략)
+    buffer = None if output_path else io.BytesIO()
+    c = canvas.Canvas(output_path or buffer, pagesize=A4)
     width, height = A4
     
     # 폰트 크기
@@ -229,6 +438,13 @@ def create_pdf(
     guide_images = classified['guide']
     table_images = classified['tables']
     
+    tag_index = build_tag_index(table_images)
+    
+    # 배경 이미지는 한 번만 디코딩해 두고 모든 페이지에서 재사용
+    cover_reader = _image_reader(cover_img, width, height)
+    page_bg_reader = _image_reader(page_bg_img, width, height)
+    chapter_bg_reader = _image_reader(chapter_bg_img, width, height)
+    
     total_steps = len(docx_contents) + 3
     current_step = 0
     
@@ -242,10 +458,9 @@ def create_pdf(
     # ============================================
     update_progress("📄 표지 생성 중...")
     
-    if cover_img:
+    if cover_reader:
         try:
-            img_buffer = io.BytesIO(cover_img)
-            c.drawImage(ImageReader(img_buffer), 0, 0, width=width, height=height)
+            c.drawImage(cover_reader, 0, 0, width=width, height=height)
         except:
             pass
     
@@ -263,17 +478,14 @@ def create_pdf(
     
     for toc_name, toc_data in toc_images:
         try:
-            img_buffer = io.BytesIO(toc_data)
-            pil_img = Image.open(img_buffer)
-            img_w, img_h = pil_img.size
+            toc_data, img_w, img_h = _prepare_image(toc_data, width, height)
             
             scale = min(width / img_w, height / img_h, 1)
             new_w = img_w * scale
             new_h = img_h * scale
             
-            img_buffer.seek(0)
             c.drawImage(
-                ImageReader(img_buffer),
+                ImageReader(io.BytesIO(toc_data)),
                 (width - new_w) / 2,
                 (height - new_h) / 2,
                 width=new_w, height=new_h,
@@ -289,41 +501,31 @@ def create_pdf(
     # 3. 본문 (장별)
     # ============================================
     page_num = 2 + len(toc_images)
-    IMG_TAG_PATTERN = re.compile(r'\{\{IMG:([^}]+)\}\}')
-    
-    def has_img_tag(text):
-        return bool(IMG_TAG_PATTERN.search(text))
     
-    def is_chapter_title(text):
-        return text.startswith("제") and "장" in text[:10]
+    used_images = set()
+    y = height - MARGIN_TOP
     
-    def is_subtitle(text):
-        # ▶, ●, ◆ 등으로 시작하거나 특정 패턴
-        return any(text.startswith(c) for c in ['▶', '●', '◆', '★', '■', '□', '○'])
+    def draw_page_bg():
+        # 내지 배경 (미리 만든 reader 재사용)
+        if page_bg_reader:
+            try:
+                c.drawImage(page_bg_reader, 0, 0, width=width, height=height)
+            except:
+                pass
     
-    used_images = set()
+    # 새 페이지 함수
+    def new_page():
+        nonlocal page_num, y
+        c.setFont(font_name, 10)
+        c.drawString(width - MARGIN_RIGHT, MARGIN_BOTTOM, str(page_num))
+        c.showPage()
+        page_num += 1
+        draw_page_bg()
+        y = height - MARGIN_TOP - 40
     
     for doc_idx, (doc_name, content) in enumerate(docx_contents):
         update_progress(f"📝 {doc_name} 처리 중...")
         
-        # 새 페이지 함수
-        def new_page():
-            nonlocal page_num, y
-            c.setFont(font_name, 10)
-            c.drawString(width - MARGIN_RIGHT, MARGIN_BOTTOM, str(page_num))
-            c.showPage()
-            page_num += 1
-            
-            # 내지 배경
-            if page_bg_img:
-                try:
-                    img_buffer = io.BytesIO(page_bg_img)
-                    c.drawImage(ImageReader(img_buffer), 0, 0, width=width, height=height)
-                except:
-                    pass
-            
-            y = height - MARGIN_TOP - 40
-        
         y = height - MARGIN_TOP
         first_item = True
         i = 0
@@ -333,12 +535,11 @@ def create_pdf(
             style = content[i]["style"]
             
             # ★ 장 제목 ★
-            if is_chapter_title(text) and first_item:
+            if first_item and _CHAPTER_RE.match(text):
                 # 장 배경
-                if chapter_bg_img:
+                if chapter_bg_reader:
                     try:
-                        img_buffer = io.BytesIO(chapter_bg_img)
-                        c.drawImage(ImageReader(img_buffer), 0, 0, width=width, height=height)
+                        c.drawImage(chapter_bg_reader, 0, 0, width=width, height=height)
                     except:
                         pass
                 
@@ -362,12 +563,7 @@ def create_pdf(
                 page_num += 1
                 
                 # 새 페이지 시작
-                if page_bg_img:
-                    try:
-                        img_buffer = io.BytesIO(page_bg_img)
-                        c.drawImage(ImageReader(img_buffer), 0, 0, width=width, height=height)
-                    except:
-                        pass
+                draw_page_bg()
                 
                 y = height - MARGIN_TOP - 40
                 first_item = False
@@ -375,14 +571,12 @@ def create_pdf(
                 continue
             
             # ★ 이미지 태그 ★
-            if has_img_tag(text):
-                tag_name, img_data, img_name = find_image_by_tag(text, table_images)
+            if '{{IMG:' in text and _IMG_TAG_RE.search(text):
+                tag_name, img_data, img_name = find_image_by_tag(text, table_images, tag_index)
                 
                 if img_data and img_name not in used_images:
                     try:
-                        img_buffer = io.BytesIO(img_data)
-                        pil_img = Image.open(img_buffer)
-                        img_w, img_h = pil_img.size
+                        img_data, img_w, img_h = _prepare_image(img_data, MAX_WIDTH, height * 0.5)
                         
                         # 최대 너비/높이 제한
                         scale = min(MAX_WIDTH / img_w, (height * 0.5) / img_h, 1)
@@ -393,12 +587,11 @@ def create_pdf(
                         if y - new_h < MARGIN_BOTTOM + 40:
                             new_page()
                         
-                        img_buffer.seek(0)
                         img_x = (width - new_w) / 2
                         img_y = y - new_h
                         
                         c.drawImage(
-                            ImageReader(img_buffer),
+                            ImageReader(io.BytesIO(img_data)),
                             img_x, img_y,
                             width=new_w, height=new_h,
                             mask='auto'
@@ -413,21 +606,12 @@ def create_pdf(
                 i += 1
                 continue
             
-            # ★ 소제목 ★
-            if is_subtitle(text):
+            # ★ 소제목 (▶, ●, ◆ 등으로 시작) ★
+            if text.startswith(_SUBTITLE_PREFIXES):
                 c.setFont(font_name, SUBTITLE_SIZE)
                 
                 # 줄바꿈 처리
-                subtitle_lines = []
-                line = ""
-                for char in text:
-                    if c.stringWidth(line + char, font_name, SUBTITLE_SIZE) < MAX_WIDTH:
-                        line += char
-                    else:
-                        subtitle_lines.append(line)
-                        line = char
-                if line:
-                    subtitle_lines.append(line)
+                subtitle_lines = wrap_text(text, font_name, SUBTITLE_SIZE, MAX_WIDTH)
                 
                 subtitle_height = len(subtitle_lines) * (SUBTITLE_SIZE + 5) + LINE_HEIGHT * 2
                 
@@ -448,16 +632,7 @@ def create_pdf(
             # ★ 본문 ★
             c.setFont(font_name, BODY_SIZE)
             
-            lines = []
-            line = ""
-            for char in text:
-                if c.stringWidth(line + char, font_name, BODY_SIZE) < MAX_WIDTH:
-                    line += char
-                else:
-                    lines.append(line)
-                    line = char
-            if line:
-                lines.append(line)
+            lines = wrap_text(text, font_name, BODY_SIZE, MAX_WIDTH)
             
             for ln in lines:
                 if y < MARGIN_BOTTOM + 40:
@@ -486,17 +661,14 @@ def create_pdf(
     
     for guide_name, guide_data in guide_images:
         try:
-            img_buffer = io.BytesIO(guide_data)
-            pil_img = Image.open(img_buffer)
-            img_w, img_h = pil_img.size
+            guide_data, img_w, img_h = _prepare_image(guide_data, width, height)
             
             scale = min(width / img_w, height / img_h, 1)
             new_w = img_w * scale
             new_h = img_h * scale
             
-            img_buffer.seek(0)
             c.drawImage(
-                ImageReader(img_buffer),
+                ImageReader(io.BytesIO(guide_data)),
                 (width - new_w) / 2,
                 (height - new_h) / 2,
                 width=new_w, height=new_h,
@@ -510,12 +682,8 @@ def create_pdf(
         progress_callback(1.0, "✅ PDF 생성 완료!")
     
     c.save()
-    buffer.seek(0)
     
-    # 파일로 저장
-    if output_path:
-        with open(output_path, 'wb') as f:
-            f.write(buffer.getvalue())
+    if buffer is not None:
         buffer.seek(0)
     
     return buffer
@@ -544,19 +712,10 @@ def create_pdf_from_files(
         저장된 PDF 경로
     """
     # Docx 읽기
-    docx_contents = []
-    for path in sorted(docx_paths):
-        name = os.path.basename(path)
-        content = read_docx(path)
-        if content:
-            docx_contents.append((name, content))
-    
-    # 이미지 읽기
-    images = {}
-    for path in image_paths:
-        name = os.path.basename(path)
-        with open(path, 'rb') as f:
-            images[name] = f.read()
+    docx_contents = read_docx_files(docx_paths)
+    
+    # 이미지 (사용할 때 mmap 으로 읽음)
+    images = LazyImageStore(image_paths)
     
     # PDF 생성
     create_pdf(
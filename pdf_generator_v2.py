@@ -8,7 +8,10 @@
 
 import os
 import re
-import io
+import glob
+import mmap
+from datetime import datetime
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
@@ -43,6 +46,43 @@ SUBTITLE_LINE_HEIGHT = SUBTITLE_SIZE * LINE_HEIGHT_RATIO
 TEXT_WIDTH = PAGE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
 TEXT_HEIGHT = PAGE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
 
+# 표지 배치
+CENTER_X = PAGE_WIDTH / 2
+COVER_TITLE_Y = PAGE_HEIGHT * 0.6
+COVER_NAME_Y = PAGE_HEIGHT * 0.45
+COVER_INFO_Y = PAGE_HEIGHT * 0.35
+COVER_DATE_Y = PAGE_HEIGHT * 0.15
+
+# 장 제목 페이지 배치
+CHAPTER_TITLE_Y = PAGE_HEIGHT * 0.55
+
+# 페이지 번호 위치
+PAGE_NUM_Y = MARGIN_BOTTOM - 10 * mm
+
+# 장 제목 (목차, 장 제목 페이지)
+CHAPTER_TITLES = {
+    1: "일년 운세 리포트의 해석 관점",
+    2: "사주 구조 핵심 요약",
+    3: "일년 전체 운의 큰 흐름",
+    4: "상반기 월별 운의 작동 구조",
+    5: "하반기 월별 운의 변화 포인트",
+    6: "감정·심리 흐름",
+    7: "인간관계 전반의 운 흐름",
+    8: "연애·부부·이성 운",
+    9: "직업·일·커리어 운",
+    10: "재물·수입·지출 운",
+    11: "건강·에너지 흐름",
+    12: "선택이 중요한 시점들",
+    13: "조심해야 할 작용",
+    14: "해 운을 활용하는 전략",
+    15: "이 한 해가 남기는 의미",
+}
+
+# 목차 줄 / 장 제목 페이지 문자열 (미리 만들어 둠)
+CHAPTER_TOC_LINES = tuple(f"제{n}장. {t}" for n, t in CHAPTER_TITLES.items())
+CHAPTER_HEADERS = {n: f"제{n}장" for n in CHAPTER_TITLES}
+
+
 
 # ============================================
 # 폰트 설정
@@ -50,48 +90,75 @@ TEXT_HEIGHT = PAGE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
 FONT_NAME = 'NanumBarunGothic'
 FONT_BOLD = 'NanumBarunGothicBold'
 FONT_LOADED = False
+_LOADED_FONTS_DIR = None  # 현재 등록된 폰트를 찾은 fonts_dir
+
+
+# 시스템 폰트 + ChosunGs (기존 프로젝트용), 우선순위 순
+FONT_CANDIDATES = (
+    'C:/Windows/Fonts/NanumBarunGothic.ttf',
+    'C:/Windows/Fonts/NanumGothic.ttf',
+    'C:/Windows/Fonts/malgun.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts', 'ChosunGs.TTF'),
+)
+
+# fonts_dir → TTF 목록
+_FONT_DIR_CACHE = {}
+
+
+def _font_dir_files(fonts_dir):
+    if fonts_dir not in _FONT_DIR_CACHE:
+        _FONT_DIR_CACHE[fonts_dir] = sorted(glob.glob(os.path.join(glob.escape(fonts_dir), '*.ttf')))
+    return _FONT_DIR_CACHE[fonts_dir]
+
+
+# 모듈 로드 시 한 번만 결정 (후보를 우선순위대로 확인)
+_FONT_PATH = next((p for p in FONT_CANDIDATES if os.path.isfile(p)), None)
+
+# setup_fonts 가 시도할 기본 후보: 로드 때 없던 앞쪽 후보는 다시 보지 않음
+_FONT_PATHS = FONT_CANDIDATES[FONT_CANDIDATES.index(_FONT_PATH):] if _FONT_PATH else FONT_CANDIDATES
 
 
 def setup_fonts(fonts_dir=None):
-    """한글 폰트 설정"""
-    global FONT_NAME, FONT_BOLD, FONT_LOADED
+    """
+    한글 폰트 설정
     
-    if FONT_LOADED:
+    fonts_dir 의 폰트를 먼저 시도하고, 그다음 모듈 로드 때 찾아 둔 경로부터 나머지 후보 순입니다.
+    이미 등록된 뒤에도 다른 fonts_dir 를 주면 그 폴더의 폰트로 다시 등록합니다.
+    """
+    global FONT_NAME, FONT_BOLD, FONT_LOADED, _LOADED_FONTS_DIR
+    
+    if FONT_LOADED and (not fonts_dir or fonts_dir == _LOADED_FONTS_DIR):
         return FONT_NAME, FONT_BOLD
     
     # 폰트 검색 경로
     font_paths = []
     
-    if fonts_dir and os.path.exists(fonts_dir):
-        font_paths.extend([
-            os.path.join(fonts_dir, f) for f in os.listdir(fonts_dir) if f.endswith('.ttf')
-        ])
-    
-    # 시스템 폰트
-    font_paths.extend([
-        'C:/Windows/Fonts/NanumBarunGothic.ttf',
-        'C:/Windows/Fonts/NanumGothic.ttf',
-        'C:/Windows/Fonts/malgun.ttf',
-        '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
-        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-    ])
+    if fonts_dir:
+        font_paths.extend(_font_dir_files(fonts_dir))
     
-    # ChosunGs (기존 프로젝트용)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    font_paths.append(os.path.join(script_dir, 'fonts', 'ChosunGs.TTF'))
+    font_paths.extend(_FONT_PATHS)
     
     for path in font_paths:
-        if os.path.exists(path):
-            try:
-                pdfmetrics.registerFont(TTFont('Korean', path))
-                pdfmetrics.registerFont(TTFont('KoreanBold', path))
-                FONT_NAME = 'Korean'
-                FONT_BOLD = 'KoreanBold'
-                FONT_LOADED = True
-                return FONT_NAME, FONT_BOLD
-            except:
-                continue
+        # 없는 경로는 registerFont 가 예외로 알려주므로 따로 확인하지 않음
+        try:
+            pdfmetrics.registerFont(TTFont('Korean', path))
+            pdfmetrics.registerFont(TTFont('KoreanBold', path))
+        except:
+            continue
+        FONT_NAME = 'Korean'
+        FONT_BOLD = 'KoreanBold'
+        FONT_LOADED = True
+        _LOADED_FONTS_DIR = fonts_dir
+        # 같은 폰트명으로 다른 파일이 등록될 수 있으므로 폭 캐시 초기화
+        _CHAR_W.clear()
+        _wrap_cached.cache_clear()
+        _centred_x.cache_clear()
+        return FONT_NAME, FONT_BOLD
     
+    if FONT_LOADED:
+        return FONT_NAME, FONT_BOLD
     return 'Helvetica', 'Helvetica-Bold'
 
 
@@ -100,47 +167,207 @@ def setup_fonts(fonts_dir=None):
 # ============================================
 IMG_TAG_PATTERN = re.compile(r'\{\{IMG:([^}]+)\}\}')
 
+# 소주제: "1." 처럼 숫자+점 또는 ▶●◆★■ 로 시작
+_SUBTITLE_RE = re.compile(r'(?:\d+\.|[▶●◆★■])')
+
+
+class _DirIndex:
+    """
+    이미지 폴더 색인 (열 단위 배열 + 키 → 위치 사전)
+    
+    - by_name: 파일명 / 확장자 뺀 이름 → 위치 (정확히 일치)
+    - by_lower: 위 키의 소문자 → 위치 (대소문자만 다른 태그)
+    - 부분 일치는 names 를 한 번 훑고 결과를 태그별로 기록
+    """
+    
+    __slots__ = ('paths', 'names', 'by_name', 'by_lower', '_substring')
+    
+    def __init__(self, images_dir):
+        self.names = tuple(os.listdir(images_dir))
+        self.paths = tuple(os.path.join(images_dir, name) for name in self.names)
+        self.by_name = {}
+        self.by_lower = {}
+        for i, name in enumerate(self.names):
+            for key in (name, os.path.splitext(name)[0]):
+                self.by_name.setdefault(key, i)
+                self.by_lower.setdefault(key.lower(), i)
+        self._substring = {}
+    
+    def lookup(self, tag_name):
+        i = self.by_name.get(tag_name)
+        if i is None:
+            i = self.by_lower.get(tag_name.lower())
+        if i is None:
+            if tag_name not in self._substring:
+                # 태그명이 파일명에 포함되어 있으면 매칭
+                self._substring[tag_name] = next(
+                    (j for j, name in enumerate(self.names) if tag_name in name), None
+                )
+            i = self._substring[tag_name]
+        return None if i is None else self.paths[i]
+
+
+@lru_cache(maxsize=8)
+def _index_dir(images_dir, dir_mtime_ns):
+    """
+    이미지 폴더 색인 (os.listdir 한 번)
+    
+    dir_mtime_ns 를 키에 넣어 파일이 추가/삭제되면 새로 만듭니다.
+    """
+    return _DirIndex(images_dir)
+
 
 def find_image(tag_name, images_dir):
     """이미지 태그에 해당하는 파일 찾기"""
-    if not images_dir or not os.path.exists(images_dir):
+    if not images_dir:
+        return None
+    try:
+        dir_mtime_ns = os.stat(images_dir).st_mtime_ns
+    except OSError:
         return None
     
-    for filename in os.listdir(images_dir):
-        # 태그명이 파일명에 포함되어 있으면 매칭
-        base_name = os.path.splitext(filename)[0]
-        if tag_name == filename or tag_name == base_name or tag_name in filename:
-            return os.path.join(images_dir, filename)
+    return _index_dir(images_dir, dir_mtime_ns).lookup(tag_name)
+
+
+# 본문 이미지 최대 크기
+IMAGE_MAX_WIDTH = TEXT_WIDTH * 0.9
+IMAGE_MAX_HEIGHT = PAGE_HEIGHT * 0.4
+
+
+def _load_reader(img_path):
+    """
+    이미지 파일 → ImageReader (크기 확인과 그리기에 같은 객체 사용)
     
-    return None
+    큰 JPEG 은 draft 로 디코딩 단계에서 축소합니다 (그릴 크기의 2배 이상 유지).
+    디코딩이 끝나면 매핑을 바로 닫으므로 파일이 열린 채로 남지 않습니다
+    (Windows 에서 같은 파일을 다시 생성할 수 있음).
+    """
+    # 파일을 메모리 매핑해서 PIL 에 넘김 (읽는 부분만 OS가 페이지 단위로 로드)
+    with open(img_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        pil_img = Image.open(mapped)
+        if pil_img.format == 'JPEG':
+            pil_img.draft('RGB', (int(IMAGE_MAX_WIDTH * 2), int(IMAGE_MAX_HEIGHT * 2)))
+        pil_img.load()
+    finally:
+        mapped.close()
+    return ImageReader(pil_img)
 
 
 # ============================================
 # 텍스트 줄바꿈
 # ============================================
-def wrap_text(text, font_name, font_size, max_width, c):
-    """텍스트를 최대 너비에 맞게 줄바꿈"""
+class _CharWidths(dict):
+    """글자 → 폭 캐시 (폰트/크기별 하나). 처음 보는 글자만 폰트 메트릭을 조회합니다."""
+    
+    def __init__(self, font_name, font_size):
+        super().__init__()
+        self.font_name = font_name
+        self.font_size = font_size
+    
+    def __missing__(self, char):
+        width = self[char] = pdfmetrics.stringWidth(char, self.font_name, self.font_size)
+        return width
+
+
+# (폰트명, 크기) → 글자 폭 캐시 (문서 전체에서 재사용)
+_CHAR_W = {}
+
+
+def _char_widths(font_name, font_size):
+    widths = _CHAR_W.get((font_name, font_size))
+    if widths is None:
+        widths = _CHAR_W[(font_name, font_size)] = _CharWidths(font_name, font_size)
+    return widths
+
+
+def char_width(char, font_name, font_size):
+    """글자 하나의 폭 (캐시)"""
+    return _char_widths(font_name, font_size)[char]
+
+
+@lru_cache(maxsize=4096)
+def _wrap_cached(text, font_name, font_size, max_width):
+    """
+    텍스트를 최대 너비에 맞게 줄바꿈 (결과 캐시, 줄 튜플 반환)
+    
+    한 줄에 들어가는 문단은 폭만 재고 그대로 반환합니다.
+    넘치는 문단은 한 줄 글자 수를 한글 폭으로 추정해 한 번에 잘라 재고,
+    넘치거나 남는 만큼만 캐시된 글자 폭으로 한 글자씩 보정합니다.
+    """
     lines = []
+    widths = _char_widths(font_name, font_size)
     
-    for paragraph in text.split('\n'):
+    # 한 줄에 들어갈 글자 수 추정 (한글 기준)
+    avg_width = widths['가']
+    estimate = max(1, int(max_width // avg_width)) if avg_width else 1
+    
+    for paragraph in text.splitlines() or ['']:
         if not paragraph.strip():
             lines.append('')
             continue
         
-        line = ''
-        for char in paragraph:
-            test_line = line + char
-            if c.stringWidth(test_line, font_name, font_size) <= max_width:
-                line = test_line
-            else:
-                if line:
-                    lines.append(line)
-                line = char
+        # 한 줄에 들어가면 나눌 필요 없음
+        if pdfmetrics.stringWidth(paragraph, font_name, font_size) <= max_width:
+            lines.append(paragraph)
+            continue
         
-        if line:
-            lines.append(line)
+        n = len(paragraph)
+        i = 0
+        while i < n:
+            j = min(n, i + estimate)
+            # 추정 구간은 한 번에 측정 (reportlab 폭 계산은 C 가속)
+            width = pdfmetrics.stringWidth(paragraph[i:j], font_name, font_size)
+            
+            # 넘치면 한 글자씩 줄임 (최소 한 글자)
+            while width > max_width and j > i + 1:
+                j -= 1
+                width -= widths[paragraph[j]]
+            
+            # 남으면 한 글자씩 늘림
+            while j < n:
+                w = widths[paragraph[j]]
+                if width + w > max_width:
+                    break
+                width += w
+                j += 1
+            
+            lines.append(paragraph[i:j])
+            i = j
     
-    return lines
+    return tuple(lines)
+
+
+def wrap_text(text, font_name, font_size, max_width, c=None):
+    """텍스트를 최대 너비에 맞게 줄바꿈 (c 는 이전 호출 호환용, 사용하지 않음)"""
+    return list(_wrap_cached(text, font_name, font_size, max_width))
+
+
+def _iter_lines(content):
+    """
+    장 내용을 한 줄씩 (문자열이면 split 없이 차례로 잘라 냄)
+    
+    파일 객체나 줄 제너레이터는 그대로 순회하므로 전체 줄 리스트를 만들지 않습니다.
+    """
+    if not isinstance(content, str):
+        yield from content
+        return
+    
+    start = 0
+    while True:
+        end = content.find('\n', start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+@lru_cache(maxsize=512)
+def _centred_x(text, font_name, font_size):
+    """가운데 정렬 시작 x 좌표 캐시 (고정 문구·장 제목·페이지 번호는 폭을 한 번만 계산)"""
+    return CENTER_X - pdfmetrics.stringWidth(text, font_name, font_size) / 2
 
 
 # ============================================
@@ -152,6 +379,8 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
     
     Args:
         chapters: {1: "제1장 내용...", 2: "제2장 내용...", ...}
+                  또는 장 순서대로 (장번호, 내용) 를 내는 이터러블
+                  (내용은 문자열, 파일 객체, 줄 제너레이터 모두 가능)
         images_dir: 이미지 폴더 경로
         customer_name: 고객 이름
         output_path: PDF 저장 경로
@@ -161,15 +390,37 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
     
     c = canvas.Canvas(output_path, pagesize=A4)
     page_num = 0
+    current_font = None
+    body_text = None  # 연속된 본문 줄을 모으는 텍스트 객체 (폰트 변경/페이지 넘김 때만 출력)
+    
+    def ensure_font(name, size):
+        """폰트가 바뀔 때만 setFont (같은 폰트 반복 설정 생략)"""
+        nonlocal current_font
+        if current_font != (name, size):
+            c.setFont(name, size)
+            current_font = (name, size)
+    
+    def draw_centred(y, text):
+        """현재 폰트 기준 가운데 정렬 (drawCentredString 의 폭 계산을 캐시로 대체)"""
+        c.drawString(_centred_x(text, *current_font), y, text)
+    
+    def flush_text():
+        """모아 둔 본문 텍스트 객체 출력"""
+        nonlocal body_text
+        if body_text is not None:
+            c.drawText(body_text)
+            body_text = None
     
     def new_page():
         """새 페이지 시작"""
-        nonlocal page_num
+        nonlocal page_num, current_font
+        flush_text()
         if page_num > 0:
             # 페이지 번호 (하단 중앙)
-            c.setFont(font_name, 10)
-            c.drawCentredString(PAGE_WIDTH / 2, MARGIN_BOTTOM - 10 * mm, str(page_num))
+            ensure_font(font_name, 10)
+            draw_centred(PAGE_NUM_Y, str(page_num))
             c.showPage()
+            current_font = None  # 새 페이지는 폰트 상태가 초기화됨
         page_num += 1
         return PAGE_HEIGHT - MARGIN_TOP
     
@@ -179,109 +430,90 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
     y = new_page()
     
     # 제목
-    c.setFont(font_bold, 40)
-    c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT * 0.6, "사주 분석 보고서")
+    ensure_font(font_bold, 40)
+    draw_centred(COVER_TITLE_Y, "사주 분석 보고서")
     
     # 고객명
-    c.setFont(font_name, 28)
-    c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT * 0.45, f"{customer_name} 님")
+    ensure_font(font_name, 28)
+    draw_centred(COVER_NAME_Y, f"{customer_name} 님")
     
     # 기본정보
     if 기본정보:
-        c.setFont(font_name, 14)
-        info_y = PAGE_HEIGHT * 0.35
-        c.drawCentredString(PAGE_WIDTH / 2, info_y, f"양력: {기본정보.get('양력', '')}")
-        c.drawCentredString(PAGE_WIDTH / 2, info_y - 20, f"음력: {기본정보.get('음력', '')}")
+        ensure_font(font_name, 14)
+        info_y = COVER_INFO_Y
+        draw_centred(info_y, f"양력: {기본정보.get('양력', '')}")
+        draw_centred(info_y - 20, f"음력: {기본정보.get('음력', '')}")
     
     # 생성일
-    from datetime import datetime
-    c.setFont(font_name, 12)
-    c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT * 0.15, f"생성일: {datetime.now().strftime('%Y년 %m월 %d일')}")
+    ensure_font(font_name, 12)
+    draw_centred(COVER_DATE_Y, f"생성일: {datetime.now().strftime('%Y년 %m월 %d일')}")
     
     # ============================================
     # 목차
     # ============================================
     y = new_page()
     
-    c.setFont(font_bold, TITLE_SIZE)
-    c.drawCentredString(PAGE_WIDTH / 2, y, "목 차")
+    ensure_font(font_bold, TITLE_SIZE)
+    draw_centred(y, "목 차")
     y -= 50
     
-    c.setFont(font_name, 14)
-    
-    chapter_titles = {
-        1: "일년 운세 리포트의 해석 관점",
-        2: "사주 구조 핵심 요약",
-        3: "일년 전체 운의 큰 흐름",
-        4: "상반기 월별 운의 작동 구조",
-        5: "하반기 월별 운의 변화 포인트",
-        6: "감정·심리 흐름",
-        7: "인간관계 전반의 운 흐름",
-        8: "연애·부부·이성 운",
-        9: "직업·일·커리어 운",
-        10: "재물·수입·지출 운",
-        11: "건강·에너지 흐름",
-        12: "선택이 중요한 시점들",
-        13: "조심해야 할 작용",
-        14: "해 운을 활용하는 전략",
-        15: "이 한 해가 남기는 의미",
-    }
-    
-    for ch_num in range(1, 16):
-        title = chapter_titles.get(ch_num, "")
-        c.drawString(MARGIN_LEFT + 20, y, f"제{ch_num}장. {title}")
+    ensure_font(font_name, 14)
+    
+    for toc_line in CHAPTER_TOC_LINES:
+        c.drawString(MARGIN_LEFT + 20, y, toc_line)
         y -= 25
         
         if y < MARGIN_BOTTOM + 50:
             y = new_page()
-            c.setFont(font_name, 14)
+            ensure_font(font_name, 14)
     
     # ============================================
     # 본문 (장별)
     # ============================================
     used_images = set()
+    readers = {}  # 이미지 경로 → ImageReader (이 PDF 에서만 사용, 저장 후 버림)
+    
+    if isinstance(chapters, dict):
+        chapters = sorted(chapters.items())
     
-    for ch_num in sorted(chapters.keys()):
-        content = chapters[ch_num]
-        ch_title = chapter_titles.get(ch_num, "")
+    for ch_num, content in chapters:
+        ch_title = CHAPTER_TITLES.get(ch_num, "")
         
         # 장 제목 페이지
         y = new_page()
         
-        c.setFont(font_bold, TITLE_SIZE)
-        c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT * 0.55, f"제{ch_num}장")
-        c.setFont(font_name, SUBTITLE_SIZE)
-        c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT * 0.55 - 45, ch_title)
+        ensure_font(font_bold, TITLE_SIZE)
+        draw_centred(CHAPTER_TITLE_Y, CHAPTER_HEADERS.get(ch_num) or f"제{ch_num}장")
+        ensure_font(font_name, SUBTITLE_SIZE)
+        draw_centred(CHAPTER_TITLE_Y - 45, ch_title)
         
         # 본문 시작
         y = new_page()
         
         # 내용 파싱 및 렌더링
-        lines = content.split('\n')
-        
-        for line in lines:
+        for line in _iter_lines(content):
             line = line.strip()
             if not line:
                 y -= BODY_LINE_HEIGHT * 0.5
                 continue
             
-            # 이미지 태그 확인
-            img_match = IMG_TAG_PATTERN.search(line)
+            # 이미지 태그 확인 (태그가 없는 대부분의 줄은 정규식 생략)
+            img_match = IMG_TAG_PATTERN.search(line) if '{{IMG:' in line else None
             if img_match:
+                flush_text()
                 tag_name = img_match.group(1)
                 img_path = find_image(tag_name, images_dir)
                 
                 if img_path and img_path not in used_images:
                     # 이미지 삽입
                     try:
-                        pil_img = Image.open(img_path)
-                        img_w, img_h = pil_img.size
+                        reader = readers.get(img_path)
+                        if reader is None:
+                            reader = readers[img_path] = _load_reader(img_path)
+                        img_w, img_h = reader.getSize()
                         
                         # 최대 크기 제한
-                        max_img_width = TEXT_WIDTH * 0.9
-                        max_img_height = PAGE_HEIGHT * 0.4
-                        
-                        scale = min(max_img_width / img_w, max_img_height / img_h, 1)
+                        scale = min(IMAGE_MAX_WIDTH / img_w, IMAGE_MAX_HEIGHT / img_h, 1)
                         new_w = img_w * scale
                         new_h = img_h * scale
                         
@@ -293,7 +525,7 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
                         img_y = y - new_h
                         
                         c.drawImage(
-                            ImageReader(img_path),
+                            reader,
                             img_x, img_y,
                             width=new_w, height=new_h,
                             mask='auto'
@@ -308,23 +540,16 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
                 continue
             
             # 소주제 판단 (숫자. 으로 시작하거나 특정 기호)
-            is_subtitle = False
-            if re.match(r'^\d+\.', line):
-                is_subtitle = True
-            elif any(line.startswith(c) for c in ['▶', '●', '◆', '★', '■']):
-                is_subtitle = True
-            
-            if is_subtitle:
+            if _SUBTITLE_RE.match(line):
                 # 소주제
-                c.setFont(font_bold, SUBTITLE_SIZE)
-                
-                wrapped = wrap_text(line, font_bold, SUBTITLE_SIZE, TEXT_WIDTH, c)
+                flush_text()
+                wrapped = _wrap_cached(line, font_bold, SUBTITLE_SIZE, TEXT_WIDTH)
                 
                 needed_height = len(wrapped) * SUBTITLE_LINE_HEIGHT + 20
                 if y - needed_height < MARGIN_BOTTOM + 30:
                     y = new_page()
-                    c.setFont(font_bold, SUBTITLE_SIZE)
                 
+                ensure_font(font_bold, SUBTITLE_SIZE)
                 y -= 15  # 소주제 전 여백
                 
                 for wline in wrapped:
@@ -334,22 +559,30 @@ def create_full_pdf(chapters, images_dir, customer_name, output_path, 기본정
                 y -= 10  # 소주제 후 여백
                 
             else:
-                # 본문
-                c.setFont(font_name, BODY_SIZE)
-                
-                wrapped = wrap_text(line, font_name, BODY_SIZE, TEXT_WIDTH, c)
+                # 본문 (문단이 이어지는 동안 텍스트 객체 하나에 계속 추가)
+                wrapped = _wrap_cached(line, font_name, BODY_SIZE, TEXT_WIDTH)
                 
                 for wline in wrapped:
                     if y < MARGIN_BOTTOM + 30:
                         y = new_page()
-                        c.setFont(font_name, BODY_SIZE)
                     
-                    c.drawString(MARGIN_LEFT, y, wline)
+                    if body_text is None:
+                        # 텍스트 객체는 캔버스의 현재 폰트를 이어받음
+                        ensure_font(font_name, BODY_SIZE)
+                        body_text = c.beginText(MARGIN_LEFT, y)
+                        body_text.setLeading(BODY_LINE_HEIGHT)
+                    elif body_text.getY() != y:
+                        # 빈 줄로 벌어진 간격만큼 시작 위치 이동 (같은 텍스트 객체 안에서)
+                        body_text.setTextOrigin(MARGIN_LEFT, y)
+                    
+                    body_text.textLine(wline)
                     y -= BODY_LINE_HEIGHT
     
+    flush_text()
+    
     # 마지막 페이지 번호
-    c.setFont(font_name, 10)
-    c.drawCentredString(PAGE_WIDTH / 2, MARGIN_BOTTOM - 10 * mm, str(page_num))
+    ensure_font(font_name, 10)
+    draw_centred(PAGE_NUM_Y, str(page_num))
     
     c.save()
     
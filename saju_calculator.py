@@ -392,8 +392,9 @@ def calc_오행_분석(사주_결과):
 # ============================================
 # 전체 사주 계산
 # ============================================
+@lru_cache(maxsize=1024)
 def calc_사주(year, month, day, hour, minute=0):
-    """전체 사주 계산"""
+    """전체 사주 계산 (캐싱 - 반환값은 읽기 전용으로 사용)"""
     년간, 년지 = calc_년주(year, month, day)
     월간, 월지 = calc_월주(년간, month, day)
     일간, 일지 = calc_일주(year, month, day)
@@ -444,12 +445,14 @@ def calc_사주(year, month, day, hour, minute=0):
 # ============================================
 # 대운 계산
 # ============================================
-def calc_대운(year, month, day, hour, minute, gender):
+def calc_대운(year, month, day, hour, minute, gender, 사주=None):
     """
     대운 계산
     gender: '남' 또는 '여'
+    사주: 이미 계산한 calc_사주 결과 (없으면 새로 계산)
     """
-    사주 = calc_사주(year, month, day, hour, minute)
+    if 사주 is None:
+        사주 = calc_사주(year, month, day, hour, minute)
     
     년간 = 사주['년주'][0]
     월간 = 사주['월주'][0]
@@ -549,16 +552,18 @@ def calc_대운(year, month, day, hour, minute, gender):
 # ============================================
 # 세운 계산 (올해 기준 ±5년)
 # ============================================
-def calc_세운(year, month, day, hour, minute, 기준년=None):
+def calc_세운(year, month, day, hour, minute, 기준년=None, 사주=None):
     """
     세운 계산 (당해년부터 10년)
+    사주: 이미 계산한 calc_사주 결과 (없으면 새로 계산)
     """
     from datetime import datetime
     
     if 기준년 is None:
         기준년 = datetime.now().year
     
-    사주 = calc_사주(year, month, day, hour, minute)
+    if 사주 is None:
+        사주 = calc_사주(year, month, day, hour, minute)
     일간 = 사주['일주'][0]
     년지 = 사주['년주'][1]
     
@@ -605,9 +610,10 @@ def calc_세운(year, month, day, hour, minute, 기준년=None):
 # ============================================
 # 월운 계산 (당해월부터 12개월)
 # ============================================
-def calc_월운(year, month, day, hour, minute, 기준년=None, 기준월=None):
+def calc_월운(year, month, day, hour, minute, 기준년=None, 기준월=None, 사주=None):
     """
     월운 계산 (당해월부터 18개월)
+    사주: 이미 계산한 calc_사주 결과 (없으면 새로 계산)
     """
     from datetime import datetime
     
@@ -617,7 +623,8 @@ def calc_월운(year, month, day, hour, minute, 기준년=None, 기준월=None):
     if 기준월 is None:
         기준월 = now.month
     
-    사주 = calc_사주(year, month, day, hour, minute)
+    if 사주 is None:
+        사주 = calc_사주(year, month, day, hour, minute)
     일간 = 사주['일주'][0]
     년지 = 사주['년주'][1]
     